@@ -12,7 +12,7 @@ from engine.combat import (
     save_game,
     start_combat,
 )
-from models.characters import AbilityScores, Attack, Character
+from models.characters import AbilityScores, Attack, Character, make_attack
 from models.game_state import GameState, GameStatus
 
 router = APIRouter()
@@ -125,6 +125,9 @@ def join_game(
 
     existing = _find_character_by_owner(game_state, owner_id)
 
+    # Share Attack instances between characters wielding the same weapon
+    attacks = [make_attack(**atk.model_dump()) for atk in body.attacks]
+
     if existing is not None and existing.is_alive:
         # Reconnect to existing living character
         save_game(game_state, SAVE_FILE)
@@ -148,7 +151,7 @@ def join_game(
             current_hp=body.max_hp,
             armor_class=body.armor_class,
             speed=body.speed,
-            attacks=body.attacks,
+            attacks=attacks,
         )
         _place_character(game_state, character)
         save_game(game_state, SAVE_FILE)
@@ -175,7 +178,7 @@ def join_game(
         current_hp=body.max_hp,
         armor_class=body.armor_class,
         speed=body.speed,
-        attacks=body.attacks,
+        attacks=attacks,
     )
     _place_character(game_state, character)
     save_game(game_state, SAVE_FILE)
@@ -3,16 +3,23 @@
 import json
 import os
 import secrets
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
+from typing import BinaryIO
 
 from fastapi import HTTPException, Request
-from pydantic import BaseModel
 
 from config import TOKENS_FILE
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
 
-class User(BaseModel):
-    """A registered API user."""
+
+@dataclass(slots=True, frozen=True)
+class User:
+    """A registered API user (immutable; replaced on update)."""
     owner_id: str
     name: str
 
@@ -20,28 +27,74 @@ class User(BaseModel):
 # In-memory token store: api_key -> User
 _tokens: dict[str, User] = {}
 
+# Secondary index kept in step with _tokens: owner_id -> api_key
+_owner_index: dict[str, str] = {}
+
+
+def _token_generator() -> str:
+    """Return the random part of a new API key (64 hex characters).
+
+    Kept as a module-level hook so tests can swap in a cheaper generator.
+    """
+    return secrets.token_hex(32)
+
+
+def _set_tokens(tokens: dict[str, User]) -> None:
+    """Replace the token store and rebuild the owner index to match."""
+    _tokens.clear()
+    _tokens.update(tokens)
+    _owner_index.clear()
+    _owner_index.update({user.owner_id: key for key, user in _tokens.items()})
+
+
+def _read_tokens(f: BinaryIO) -> dict[str, User]:
+    """Parse a serialized token store from a binary file object."""
+    raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    # Build from the known fields so extra keys in the file are ignored
+    return {
+        key: User(owner_id=value["owner_id"], name=value["name"])
+        for key, value in data.items()
+    }
+
+
+def _write_tokens(f: BinaryIO) -> None:
+    """Serialize the in-memory token store to a binary file object."""
+    data = {key: asdict(user) for key, user in _tokens.items()}
+    if orjson is not None:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        f.write(json.dumps(data, indent=2).encode())
 
-def load_tokens(path: str = TOKENS_FILE) -> dict[str, User]:
+
+def load_tokens(path: str | None = None) -> dict[str, User]:
     """Load token store from JSON file.
 
+    Args:
+        path: File to read. Defaults to TOKENS_FILE, resolved at call time.
+
     Returns:
         Dict mapping API keys to User objects.
     """
-    _tokens.clear()
+    path = path or TOKENS_FILE
     if not Path(path).exists():
+        _set_tokens({})
         return _tokens
-    with open(path) as f:
-        data = json.load(f)
-    _tokens.update({key: User(**value) for key, value in data.items()})
+    with open(path, "rb") as f:
+        _set_tokens(_read_tokens(f))
     return _tokens
 
 
-def save_tokens(path: str = TOKENS_FILE) -> None:
-    """Persist token store to JSON file (atomic write)."""
+def save_tokens(path: str | None = None) -> None:
+    """Persist token store to JSON file (atomic write).
+
+    Args:
+        path: File to write. Defaults to TOKENS_FILE, resolved at call time.
+    """
+    path = path or TOKENS_FILE
     tmp_path = path + ".tmp"
-    data = {key: user.model_dump() for key, user in _tokens.items()}
-    with open(tmp_path, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(tmp_path, "wb") as f:
+        _write_tokens(f)
     os.replace(tmp_path, path)
 
 
@@ -58,12 +111,12 @@ def create_token(owner_id: str, name: str) -> str:
     Raises:
         ValueError: If owner_id is already registered.
     """
-    for user in _tokens.values():
-        if user.owner_id == owner_id:
-            raise ValueError(f"owner_id '{owner_id}' is already registered")
+    if owner_id in _owner_index:
+        raise ValueError(f"owner_id '{owner_id}' is already registered")
 
-    api_key = "sk_" + secrets.token_hex(32)
+    api_key = "sk_" + _token_generator()
     _tokens[api_key] = User(owner_id=owner_id, name=name)
+    _owner_index[owner_id] = api_key
     save_tokens()
     return api_key
 
@@ -84,7 +137,7 @@ def get_current_user(request: Request) -> User:
         raise HTTPException(status_code=401, detail="Missing or invalid Authorization header")
 
     token = auth_header[len("Bearer "):]
-    user = _tokens.get(token)
+    user = get_user_by_token(token)
     if user is None:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
@@ -92,7 +145,11 @@ def get_current_user(request: Request) -> User:
 
 
 def get_user_by_token(token: str) -> User | None:
-    """Look up a user by raw API key (for WebSocket auth)."""
+    """Look up a user by raw API key.
+
+    Single lookup path for both REST (get_current_user) and WebSocket auth.
+    The store is keyed by the full 256-bit key, so this is one dict probe.
+    """
     return _tokens.get(token)
 
 
@@ -105,14 +162,10 @@ def delete_token(owner_id: str) -> bool:
     Returns:
         True if the user was found and deleted, False if not found.
     """
-    key_to_delete = None
-    for key, user in _tokens.items():
-        if user.owner_id == owner_id:
-            key_to_delete = key
-            break
-    if key_to_delete is None:
+    key = _owner_index.pop(owner_id, None)
+    if key is None:
         return False
-    del _tokens[key_to_delete]
+    del _tokens[key]
     save_tokens()
     return True
 
@@ -127,12 +180,12 @@ def update_user(owner_id: str, name: str) -> bool:
     Returns:
         True if the user was found and updated, False if not found.
     """
-    for user in _tokens.values():
-        if user.owner_id == owner_id:
-            user.name = name
-            save_tokens()
-            return True
-    return False
+    key = _owner_index.get(owner_id)
+    if key is None:
+        return False
+    _tokens[key] = replace(_tokens[key], name=name)
+    save_tokens()
+    return True
 
 
 def get_token_for_owner(owner_id: str) -> str | None:
@@ -144,10 +197,7 @@ def get_token_for_owner(owner_id: str) -> str | None:
     Returns:
         The API key string, or None if the owner_id is not registered.
     """
-    for key, user in _tokens.items():
-        if user.owner_id == owner_id:
-            return key
-    return None
+    return _owner_index.get(owner_id)
 
 
 def rotate_token(owner_id: str) -> str | None:
@@ -159,17 +209,12 @@ def rotate_token(owner_id: str) -> str | None:
     Returns:
         The new API key string, or None if the owner_id is not registered.
     """
-    old_key = None
-    old_user = None
-    for key, user in _tokens.items():
-        if user.owner_id == owner_id:
-            old_key = key
-            old_user = user
-            break
-    if old_key is None or old_user is None:
+    old_key = _owner_index.get(owner_id)
+    if old_key is None:
         return None
-    del _tokens[old_key]
-    new_key = "sk_" + secrets.token_hex(32)
-    _tokens[new_key] = old_user
+    user = _tokens.pop(old_key)
+    new_key = "sk_" + _token_generator()
+    _tokens[new_key] = user
+    _owner_index[owner_id] = new_key
     save_tokens()
     return new_key
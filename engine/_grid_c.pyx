@@ -0,0 +1,58 @@
+# cython: language_level=3
+"""Compiled versions of the hot grid helpers in engine.grid.
+
+Built with ``python setup.py build_ext --inplace``. engine.grid imports
+these when available and otherwise falls back to its pure-Python versions,
+which remain the reference implementation.
+"""
+
+cimport cython
+
+from config import SQUARE_SIZE_FT
+
+cdef int _SQUARE_SIZE_FT = SQUARE_SIZE_FT
+
+
+def distance(pos1, pos2) -> int:
+    """Chebyshev distance in feet between two (x, y) grid positions."""
+    cdef int dx = abs(<int>pos1[0] - <int>pos2[0])
+    cdef int dy = abs(<int>pos1[1] - <int>pos2[1])
+    return (dx if dx > dy else dy) * _SQUARE_SIZE_FT
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def line_of_sight(pos1, pos2, list grid) -> bint:
+    """Bresenham line-of-sight check; only walls block.
+
+    The line walk runs on C ints; the grid is only touched for the cells
+    on the line itself.
+    """
+    cdef int x0 = pos1[0], y0 = pos1[1]
+    cdef int x1 = pos2[0], y1 = pos2[1]
+    cdef int sx0 = x0, sy0 = y0
+    cdef int dx = abs(x1 - x0)
+    cdef int dy = abs(y1 - y0)
+    cdef int sx = 1 if x0 < x1 else -1
+    cdef int sy = 1 if y0 < y1 else -1
+    cdef int err = dx - dy
+    cdef int e2
+    cdef int height = len(grid)
+    cdef int width = len(grid[0]) if height else 0
+
+    while True:
+        if (x0 != sx0 or y0 != sy0) and (x0 != x1 or y0 != y1):
+            if 0 <= y0 < height and 0 <= x0 < width:
+                if grid[y0][x0].terrain == "wall":
+                    return False
+        if x0 == x1 and y0 == y1:
+            break
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x0 += sx
+        if e2 < dx:
+            err += dx
+            y0 += sy
+
+    return True
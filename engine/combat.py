@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
@@ -22,17 +21,24 @@ from models.characters import Character
 from models.game_state import GameEvent, GameState, GameStatus
 
 
-def create_game(game_id: str, name: str = "Arena") -> GameState:
+def create_game(
+    game_id: str,
+    name: str = "Arena",
+    width: int = GRID_WIDTH,
+    height: int = GRID_HEIGHT,
+) -> GameState:
     """Initialize a new game with an empty grid.
 
     Args:
         game_id: Unique identifier for the game.
         name: Display name for the game.
+        width: Grid width in squares.
+        height: Grid height in squares.
 
     Returns:
         A fresh GameState ready for players to join.
     """
-    grid = create_grid(GRID_WIDTH, GRID_HEIGHT)
+    grid = create_grid(width, height)
     return GameState(
         game_id=game_id,
         name=name,
@@ -54,12 +60,12 @@ def spawn_npcs(game_state: GameState) -> None:
                 return
 
         golem = create_golem()
-        pos = golem_center_position()
+        grid_w = len(game_state.grid[0])
+        grid_h = len(game_state.grid)
+        pos = golem_center_position(grid_w, grid_h)
         # If centre is occupied, nudge by searching nearby
         x, y = pos
         if game_state.grid[y][x].occupant_id is not None:
-            grid_w = len(game_state.grid[0])
-            grid_h = len(game_state.grid)
             for dx in range(grid_w):
                 for dy in range(grid_h):
                     nx, ny = (x + dx) % grid_w, (y + dy) % grid_h
@@ -481,16 +487,16 @@ def transition_to_waiting(game_state: GameState) -> None:
 def save_game(game_state: GameState, path: str) -> None:
     """Persist game state to a JSON file.
 
-    Writes to a temporary file first, then renames for atomicity.
+    Serializes with Pydantic's native JSON encoder, writing to a temporary
+    file first, then renaming for atomicity.
 
     Args:
         game_state: The game state to save.
         path: File path to write to.
     """
     tmp_path = path + ".tmp"
-    data = game_state.model_dump(mode="json")
-    with open(tmp_path, "w") as f:
-        json.dump(data, f, default=str)
+    with open(tmp_path, "wb") as f:
+        f.write(game_state.model_dump_json().encode())
     os.replace(tmp_path, path)
 
 
@@ -505,9 +511,8 @@ def load_game(path: str) -> GameState | None:
     """
     if not Path(path).exists():
         return None
-    with open(path) as f:
-        data = json.load(f)
-    return GameState.model_validate(data)
+    with open(path, "rb") as f:
+        return GameState.model_validate_json(f.read())
 
 
 def _new_deadline() -> datetime:
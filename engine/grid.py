@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pydantic import TypeAdapter
+
 from config import SQUARE_SIZE_FT
 from models.game_state import GridCell
 
@@ -11,6 +13,9 @@ if TYPE_CHECKING:
     from models.characters import Character
     from models.game_state import GameState
 
+# Validates a whole grid in one pydantic-core call instead of one per cell
+_GRID_ADAPTER = TypeAdapter(list[list[GridCell]])
+
 
 def create_grid(width: int, height: int) -> list[list[GridCell]]:
     """Initialize an empty grid of GridCells.
@@ -22,10 +27,10 @@ def create_grid(width: int, height: int) -> list[list[GridCell]]:
     Returns:
         A 2D list indexed as grid[y][x].
     """
-    return [
-        [GridCell(x=x, y=y) for x in range(width)]
+    return _GRID_ADAPTER.validate_python([
+        [{"x": x, "y": y} for x in range(width)]
         for y in range(height)
-    ]
+    ])
 
 
 def distance(pos1: tuple[int, int], pos2: tuple[int, int]) -> int:
@@ -219,3 +224,20 @@ def line_of_sight(
             y0 += sy
 
     return True
+
+
+# The pure-Python versions above are the reference implementation and the
+# fallback; keep them reachable so they stay tested once the extension is built.
+_py_distance = distance
+_py_line_of_sight = line_of_sight
+
+# Use the compiled helpers when the Cython extension has been built
+# (python setup.py build_ext --inplace).
+try:
+    from engine._grid_c import distance as _c_distance
+    from engine._grid_c import line_of_sight as _c_line_of_sight
+except ImportError:
+    pass
+else:
+    distance = _c_distance
+    line_of_sight = _c_line_of_sight
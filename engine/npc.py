@@ -7,7 +7,7 @@ from uuid import uuid4
 from config import GRID_HEIGHT, GRID_WIDTH
 from engine.grid import is_adjacent
 from models.actions import ActionRequest, ActionType
-from models.characters import AbilityScores, Attack, Character
+from models.characters import AbilityScores, Character, make_attack
 from models.game_state import GameState
 
 # Reserved owner_id for all server NPCs — no real user can have this.
@@ -47,7 +47,7 @@ def create_golem() -> Character:
         armor_class=8,
         speed=0,
         attacks=[
-            Attack(
+            make_attack(
                 name="Stone Fist",
                 attack_bonus=6,
                 damage_dice="1d1",
@@ -60,9 +60,12 @@ def create_golem() -> Character:
     )
 
 
-def golem_center_position() -> tuple[int, int]:
-    """Return the center of the grid for GOLEM placement."""
-    return (GRID_WIDTH // 2, GRID_HEIGHT // 2)
+def golem_center_position(
+    width: int = GRID_WIDTH,
+    height: int = GRID_HEIGHT,
+) -> tuple[int, int]:
+    """Return the center of a width x height grid for GOLEM placement."""
+    return (width // 2, height // 2)
 
 
 # ---------------------------------------------------------------------------
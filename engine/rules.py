@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from enum import Enum
 from typing import TYPE_CHECKING
 
 from engine.dice import roll, roll_d20
@@ -13,6 +14,25 @@ if TYPE_CHECKING:
     from models.game_state import GameState
 
 
+class ErrorCode(str, Enum):
+    """Fixed validation errors; the value is the message sent to the bot."""
+    CASTER_DEAD = "Character is dead"
+    NO_POSITION = "Character has no position"
+    NEEDS_POSITION = "Move action requires a target_position"
+    NO_TARGET = "Attack action requires a target_id"
+    DEAD_TARGET = "Target is already dead"
+    TARGET_NO_POSITION = "Target has no position"
+    NO_ATTACKS = "Character has no attacks"
+    NO_LINE_OF_SIGHT = "No line of sight to target"
+
+    # Format as the message, not "ErrorCode.NAME", wherever it is logged or interpolated
+    def __str__(self) -> str:
+        return self.value
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
+
 def calculate_ability_modifier(score: int) -> int:
     """Calculate ability modifier from a score using the 5e formula.
 
@@ -57,32 +77,33 @@ def validate_action(
         weapon_name: Name of the weapon to use (for attacks).
 
     Returns:
-        (valid, error_message) tuple.
+        (valid, error_message) tuple. Fixed errors are ErrorCode members;
+        errors that carry details (ids, distances) are plain strings.
     """
     if not character.is_alive:
-        return False, "Character is dead"
+        return False, ErrorCode.CASTER_DEAD
 
     if character.position is None:
-        return False, "Character has no position"
+        return False, ErrorCode.NO_POSITION
 
     if action_type == ActionType.END_TURN:
         return True, ""
 
     if action_type == ActionType.MOVE:
         if target_position is None:
-            return False, "Move action requires a target_position"
+            return False, ErrorCode.NEEDS_POSITION
         return True, ""
 
     if action_type == ActionType.ATTACK:
         if target_id is None:
-            return False, "Attack action requires a target_id"
+            return False, ErrorCode.NO_TARGET
         if target_id not in game_state.characters:
             return False, f"Target '{target_id}' not found"
         target = game_state.characters[target_id]
         if not target.is_alive:
-            return False, "Target is already dead"
+            return False, ErrorCode.DEAD_TARGET
         if target.position is None:
-            return False, "Target has no position"
+            return False, ErrorCode.TARGET_NO_POSITION
 
         # Find weapon
         weapon = None
@@ -95,7 +116,7 @@ def validate_action(
                 return False, f"Weapon '{weapon_name}' not found"
         else:
             if not character.attacks:
-                return False, "Character has no attacks"
+                return False, ErrorCode.NO_ATTACKS
             weapon = character.attacks[0]
 
         # Check range
@@ -108,7 +129,7 @@ def validate_action(
                 return False, f"Target is out of reach ({dist}ft, reach {weapon.reach}ft)"
 
         if not line_of_sight(character.position, target.position, game_state.grid):
-            return False, "No line of sight to target"
+            return False, ErrorCode.NO_LINE_OF_SIGHT
 
         return True, ""
 
@@ -1,57 +1,74 @@
 """FastAPI app entry point for Tendrils Server."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from api.admin import router as admin_router
-from api.lobby import router as lobby_router
 from api.game import router as game_router
+from api.lobby import router as lobby_router
 from api.ws import router as ws_router
 from auth import load_tokens
 from config import GAME_ID, GAME_NAME, SAVE_FILE, load_secret
 from engine.combat import create_game, end_combat, load_game, save_game, spawn_npcs
-from models.game_state import GameStatus
-
-app = FastAPI(
-    title="Tendrils Server",
-    description="A headless Dungeon Master for AI bot combat arenas",
-    version="0.1.0",
-)
-
-# Load persisted admin secret (overrides env var if file exists)
-load_secret()
+from models.game_state import GameState, GameStatus
 
-# Load token store
-load_tokens()
 
-# Load or create the singleton game
-loaded = load_game(SAVE_FILE)
-if loaded is not None:
-    app.state.game = loaded
-    # If the server restarts while in COMPLETED state, transition to WAITING
-    if loaded.status == GameStatus.COMPLETED:
-        end_combat(loaded)
+def _init_game() -> GameState:
+    """Load the singleton game from disk, or create it on first run."""
+    loaded = load_game(SAVE_FILE)
+    if loaded is not None:
+        game = loaded
+        # If the server restarts while in COMPLETED state, transition to WAITING
+        if game.status == GameStatus.COMPLETED:
+            end_combat(game)
+    else:
+        game = create_game(GAME_ID, name=GAME_NAME)
     # Ensure NPCs are present (idempotent)
-    spawn_npcs(loaded)
-    save_game(loaded, SAVE_FILE)
-else:
-    game = create_game(GAME_ID, name=GAME_NAME)
     spawn_npcs(game)
     save_game(game, SAVE_FILE)
-    app.state.game = game
+    return game
+
 
-app.include_router(admin_router, prefix="/admin", tags=["Admin"])
-app.include_router(lobby_router, prefix="/game", tags=["Lobby"])
-app.include_router(game_router, prefix="/game", tags=["Game"])
-app.include_router(ws_router, prefix="/game", tags=["WebSocket"])
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Load or create the game at startup instead of at import time."""
+    app.state.game = _init_game()
+    yield
 
 
-@app.get("/")
-def root() -> dict:
-    """Root endpoint returning server info."""
-    return {"name": "Tendrils Server", "version": "0.1.0", "status": "running"}
+def create_app() -> FastAPI:
+    """Build the FastAPI app and register its routers."""
+    app = FastAPI(
+        title="Tendrils Server",
+        description="A headless Dungeon Master for AI bot combat arenas",
+        version="0.1.0",
+        lifespan=lifespan,
+    )
 
+    app.include_router(admin_router, prefix="/admin", tags=["Admin"])
+    app.include_router(lobby_router, prefix="/game", tags=["Lobby"])
+    app.include_router(game_router, prefix="/game", tags=["Game"])
+    app.include_router(ws_router, prefix="/game", tags=["WebSocket"])
+
+    @app.get("/")
+    def root() -> dict:
+        """Root endpoint returning server info."""
+        return {"name": "Tendrils Server", "version": "0.1.0", "status": "running"}
+
+    @app.get("/health")
+    def health() -> dict:
+        """Health check endpoint."""
+        return {"healthy": True}
+
+    return app
+
+
+# Load persisted admin secret (overrides env var if file exists)
+load_secret()
+
+# Load token store
+load_tokens()
 
-@app.get("/health")
-def health() -> dict:
-    """Health check endpoint."""
-    return {"healthy": True}
+app = create_app()
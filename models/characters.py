@@ -1,10 +1,18 @@
 """Character and creature data models for Tendrils Server."""
 
-from pydantic import BaseModel
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict
 
 
 class Attack(BaseModel):
-    """A weapon or natural attack a character can make."""
+    """A weapon or natural attack a character can make.
+
+    Frozen so a single instance can be shared by every character wielding
+    the same weapon (see make_attack).
+    """
+    model_config = ConfigDict(frozen=True)
+
     name: str                       # e.g., "Longsword"
     attack_bonus: int               # Added to d20 roll
     damage_dice: str                # e.g., "1d8"
@@ -15,6 +23,34 @@ class Attack(BaseModel):
     range_long: int | None = None   # Disadvantage range
 
 
+@lru_cache(maxsize=256)
+def make_attack(
+    name: str,
+    attack_bonus: int,
+    damage_dice: str,
+    damage_bonus: int,
+    damage_type: str,
+    reach: int = 5,
+    range_normal: int | None = None,
+    range_long: int | None = None,
+) -> Attack:
+    """Return a shared Attack instance for the given weapon stats.
+
+    Identical weapons across characters and games resolve to the same
+    object instead of allocating a new model per character.
+    """
+    return Attack(
+        name=name,
+        attack_bonus=attack_bonus,
+        damage_dice=damage_dice,
+        damage_bonus=damage_bonus,
+        damage_type=damage_type,
+        reach=reach,
+        range_normal=range_normal,
+        range_long=range_long,
+    )
+
+
 class AbilityScores(BaseModel):
     """The six core ability scores."""
     strength: int = 10
@@ -0,0 +1,17 @@
+"""Build script for the optional compiled grid helpers.
+
+The server runs without this step; building the extension only swaps in
+faster versions of engine.grid.distance and engine.grid.line_of_sight.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="tendrils-server",
+    ext_modules=cythonize("engine/_grid_c.pyx", language_level=3),
+)
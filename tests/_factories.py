@@ -0,0 +1,66 @@
+"""Shared model factories for the test suite."""
+
+import functools
+from typing import Final
+
+from models.characters import AbilityScores, Attack, Character
+
+
+@functools.lru_cache(maxsize=None)
+def _ability_scores(dex: int) -> AbilityScores:
+    """One AbilityScores per dexterity, shared by every character (never mutated)."""
+    return AbilityScores(dexterity=dex)
+
+
+_SWORD: Final = Attack(
+    name="Sword",
+    attack_bonus=5,
+    damage_dice="1d8",
+    damage_bonus=3,
+    damage_type="slashing",
+    reach=5,
+)
+
+# Validated once and never mutated; every factory call is a model_copy of this
+_PROTO: Final = Character(
+    id="_",
+    name="_",
+    owner_id="_",
+    ability_scores=_ability_scores(14),
+    max_hp=20,
+    current_hp=20,
+    armor_class=15,
+    speed=30,
+    attacks=[_SWORD],
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _specialized(char_id: str, owner_id: str, hp: int, ac: int, dex: int) -> Character:
+    """The prototype specialized for one argument tuple (shared, do not mutate)."""
+    return _PROTO.model_copy(update={
+        "id": char_id,
+        "name": f"Char_{char_id}",
+        "owner_id": owner_id,
+        "max_hp": hp,
+        "current_hp": hp,
+        "armor_class": ac,
+        "ability_scores": _ability_scores(dex),
+    })
+
+
+def make_character(
+    char_id: str = "c1",
+    owner_id: str = "owner1",
+    hp: int = 20,
+    ac: int = 15,
+    dex: int = 14,
+    position: tuple[int, int] | None = None,
+) -> Character:
+    """Create a test character armed with a sword."""
+    # model_copy is shallow: hand out fresh mutable lists per character.
+    return _specialized(char_id, owner_id, hp, ac, dex).model_copy(update={
+        "position": position,
+        "conditions": [],
+        "attacks": [_SWORD],
+    })
@@ -0,0 +1,109 @@
+"""Shared pytest fixtures for the Tendrils Server test suite."""
+
+import itertools
+import os
+import pickle
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.admin
+import api.game
+import api.lobby
+import auth
+import config
+import main
+from engine.combat import create_game
+from models.game_state import GameState
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "real_fs: persist the token store to real files instead of memory",
+    )
+    config.addinivalue_line(
+        "markers", "real_tokens: generate API keys with secrets instead of a counter",
+    )
+    # Keep tmp_path (save files, tokens.json) in RAM when tmpfs is available.
+    # Only the temp root moves: pytest still creates a locked, numbered
+    # pytest-of-<user>/pytest-N directory per run under it.
+    if os.access("/dev/shm", os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")
+
+
+# Smallest board that still fits every test coordinate
+_TEST_GRID_SIZE = 12
+
+
+@pytest.fixture(scope="session")
+def _proto_game() -> bytes:
+    """An empty test-size game, pickled once per session."""
+    return pickle.dumps(create_game("game1", width=_TEST_GRID_SIZE, height=_TEST_GRID_SIZE))
+
+
+@pytest.fixture
+def gs(_proto_game) -> GameState:
+    """A fresh empty game, copied from the session prototype."""
+    return pickle.loads(_proto_game)
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    """The FastAPI app shared by the whole test session.
+
+    The game save file is redirected to a per-session temp directory so
+    parallel test workers never share game_state.json.
+    """
+    save_file = str(tmp_path_factory.mktemp("data") / "game_state.json")
+    with pytest.MonkeyPatch.context() as mp:
+        for module in (main, api.admin, api.game, api.lobby):
+            mp.setattr(module, "SAVE_FILE", save_file)
+        yield main.app
+
+
+@pytest.fixture(scope="session")
+def base_client(app):
+    """A single TestClient shared by the session; lifespan runs once."""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def _initial_game(base_client) -> bytes:
+    """The game as the lifespan left it, pickled for cheap per-test resets."""
+    return pickle.dumps(base_client.app.state.game)
+
+
+@pytest.fixture
+def tokens_client(base_client, _initial_game, tmp_path, monkeypatch):
+    """The shared client with a fresh game and the token store pointed at a per-test file."""
+    base_client.app.state.game = pickle.loads(_initial_game)
+    tokens_file = str(tmp_path / "tokens.json")
+    monkeypatch.setattr(config, "TOKENS_FILE", tokens_file)
+    monkeypatch.setattr(auth, "TOKENS_FILE", tokens_file)
+    auth.load_tokens(tokens_file)
+    return base_client
+
+
+# Keeps keys unique across the whole session
+_token_counter = itertools.count()
+_real_token_generator = auth._token_generator
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_tokens():
+    """Replace API key randomness with a counter for the whole session.
+
+    Session-scoped so that session- and class-scoped fixtures, which are set
+    up before any function-scoped autouse fixture, mint counter keys too.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth, "_token_generator", lambda: f"{next(_token_counter):064x}")
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _real_tokens(request, monkeypatch):
+    """Restore the secrets-backed generator for tests marked ``real_tokens``."""
+    if request.node.get_closest_marker("real_tokens"):
+        monkeypatch.setattr(auth, "_token_generator", _real_token_generator)
@@ -1,14 +1,20 @@
 """Tests for API key authentication and admin endpoints."""
 
+import functools
+import io
 import json
-import os
-import tempfile
+import pickle
+from dataclasses import dataclass
+from types import SimpleNamespace
 
 import pytest
 from fastapi.testclient import TestClient
 
+import auth
+from api.lobby import JoinGameRequest, join_game
 from auth import (
     User,
+    _owner_index,
     _tokens,
     create_token,
     delete_token,
@@ -21,12 +27,81 @@ from auth import (
 )
 
 
+# Request bodies shared by the join calls below
+_ATTACK = {
+    "name": "Sword",
+    "attack_bonus": 5,
+    "damage_dice": "1d8",
+    "damage_bonus": 3,
+    "damage_type": "slashing",
+}
+_BASE_CHAR = {"max_hp": 20, "armor_class": 15, "attacks": [_ATTACK]}
+
+ADMIN_HEADERS = {"X-Admin-Secret": "change-me-in-production"}
+_BAD_SECRET = {"X-Admin-Secret": "wrong"}
+_REGISTER_BOT_A = {"owner_id": "bot_a", "name": "Bot A"}
+
+
+@functools.lru_cache(maxsize=64)
+def _auth(key: str) -> dict[str, str]:
+    """Bearer auth headers for an API key (shared, do not mutate)."""
+    return {"Authorization": f"Bearer {key}"}
+
+
+# In-memory stand-in for tokens.json files: path -> serialized bytes
+_fake_fs: dict[str, bytes] = {}
+
+
+@pytest.fixture(autouse=True)
+def _in_memory_token_files(request, monkeypatch):
+    """Keep the token store's own saves/loads in memory.
+
+    The real serializers run against BytesIO buffers instead of files.
+    Tests marked ``real_fs`` keep the file-backed implementation, pointed
+    at a per-test temp file.
+    """
+    if request.node.get_closest_marker("real_fs"):
+        tmp_path = request.getfixturevalue("tmp_path")
+        monkeypatch.setattr(auth, "TOKENS_FILE", str(tmp_path / "tokens.json"))
+        yield
+        return
+
+    def fake_save(path: str | None = None) -> None:
+        buf = io.BytesIO()
+        auth._write_tokens(buf)
+        _fake_fs[path or auth.TOKENS_FILE] = buf.getvalue()
+
+    def fake_load(path: str | None = None) -> dict[str, User]:
+        raw = _fake_fs.get(path or auth.TOKENS_FILE)
+        auth._set_tokens(auth._read_tokens(io.BytesIO(raw)) if raw is not None else {})
+        return _tokens
+
+    monkeypatch.setattr(auth, "save_tokens", fake_save)
+    monkeypatch.setattr(auth, "load_tokens", fake_load)
+    yield
+    _fake_fs.clear()
+
+
 @pytest.fixture(autouse=True)
 def _clear_tokens():
     """Reset token store before each test."""
-    _tokens.clear()
+    auth._set_tokens({})
     yield
-    _tokens.clear()
+    # The owner index must never drift from the token store
+    assert len(_owner_index) == len(_tokens)
+    auth._set_tokens({})
+
+
+def _fast_register(owner_id: str, name: str) -> str:
+    """Register a user directly in the token store and return the API key."""
+    return create_token(owner_id, name)
+
+
+def _fast_join(app, owner_id: str, name: str = "Fighter") -> str:
+    """Join the game in-process, bypassing HTTP, and return the character_id."""
+    body = JoinGameRequest(**{**_BASE_CHAR, "name": name})
+    user = User(owner_id=owner_id, name=owner_id)
+    return join_game(body, SimpleNamespace(app=app), user).character_id
 
 
 class TestTokenStore:
@@ -37,6 +112,7 @@ class TestTokenStore:
         tokens = load_tokens(path)
         assert tokens == {}
 
+    @pytest.mark.real_fs
     def test_create_and_save_roundtrip(self, tmp_path):
         path = str(tmp_path / "tokens.json")
         load_tokens(path)
@@ -51,11 +127,40 @@ class TestTokenStore:
         assert loaded[key].owner_id == "bot_a"
         assert loaded[key].name == "Bot A"
 
+    @pytest.mark.real_fs
+    def test_saved_file_is_plain_json(self, tmp_path):
+        path = str(tmp_path / "tokens.json")
+        key = create_token("bot_a", "Bot A")
+        save_tokens(path)
+        with open(path) as f:
+            data = json.load(f)
+        assert data == {key: {"owner_id": "bot_a", "name": "Bot A"}}
+
+    @pytest.mark.real_fs
+    def test_load_ignores_unknown_fields(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        path.write_text(json.dumps(
+            {"sk_abc": {"owner_id": "bot_a", "name": "Bot A", "created_at": "2024-01-01"}},
+        ))
+        loaded = load_tokens(str(path))
+        assert loaded["sk_abc"] == User(owner_id="bot_a", name="Bot A")
+
     def test_create_token_prefix(self):
         key = create_token("bot_a", "Bot A")
         assert key.startswith("sk_")
         assert len(key) == 3 + 64  # "sk_" + 32 bytes hex
 
+    @pytest.mark.real_tokens
+    def test_create_token_uses_secrets(self, monkeypatch):
+        calls = []
+        real_token_hex = auth.secrets.token_hex
+        monkeypatch.setattr(
+            auth.secrets, "token_hex", lambda n: calls.append(n) or real_token_hex(n),
+        )
+        key = create_token("bot_a", "Bot A")
+        assert calls == [32]
+        assert len(key) == 3 + 64
+
     def test_duplicate_owner_id_rejected(self):
         create_token("bot_a", "Bot A")
         with pytest.raises(ValueError, match="already registered"):
@@ -74,59 +179,42 @@ class TestTokenStore:
 class TestAdminEndpoint:
     """Tests for POST /admin/register."""
 
-    @pytest.fixture
-    def client(self, tmp_path):
-        """Create a test client with a temporary token store."""
-        # Patch TOKENS_FILE for this test
-        import auth
-        import config
-        old_tokens_file = config.TOKENS_FILE
-        config.TOKENS_FILE = str(tmp_path / "tokens.json")
-        auth.TOKENS_FILE = config.TOKENS_FILE
-
-        from main import app
-        load_tokens(config.TOKENS_FILE)
-        yield TestClient(app)
-
-        config.TOKENS_FILE = old_tokens_file
-        auth.TOKENS_FILE = old_tokens_file
-
-    def test_register_success(self, client):
-        resp = client.post(
+    def test_register_success(self, tokens_client):
+        resp = tokens_client.post(
             "/admin/register",
-            json={"owner_id": "bot_a", "name": "Bot A"},
-            headers={"X-Admin-Secret": "change-me-in-production"},
+            json=_REGISTER_BOT_A,
+            headers=ADMIN_HEADERS,
         )
         assert resp.status_code == 200
         data = resp.json()
         assert data["owner_id"] == "bot_a"
         assert data["api_key"].startswith("sk_")
 
-    def test_register_wrong_secret(self, client):
-        resp = client.post(
+    def test_register_wrong_secret(self, tokens_client):
+        resp = tokens_client.post(
             "/admin/register",
-            json={"owner_id": "bot_a", "name": "Bot A"},
-            headers={"X-Admin-Secret": "wrong-secret"},
+            json=_REGISTER_BOT_A,
+            headers=_BAD_SECRET,
         )
         assert resp.status_code == 403
 
-    def test_register_missing_secret(self, client):
-        resp = client.post(
+    def test_register_missing_secret(self, tokens_client):
+        resp = tokens_client.post(
             "/admin/register",
-            json={"owner_id": "bot_a", "name": "Bot A"},
+            json=_REGISTER_BOT_A,
         )
         assert resp.status_code == 422  # Missing required header
 
-    def test_register_duplicate_owner(self, client):
-        client.post(
+    def test_register_duplicate_owner(self, tokens_client):
+        tokens_client.post(
             "/admin/register",
-            json={"owner_id": "bot_a", "name": "Bot A"},
-            headers={"X-Admin-Secret": "change-me-in-production"},
+            json=_REGISTER_BOT_A,
+            headers=ADMIN_HEADERS,
         )
-        resp = client.post(
+        resp = tokens_client.post(
             "/admin/register",
-            json={"owner_id": "bot_a", "name": "Bot A Again"},
-            headers={"X-Admin-Secret": "change-me-in-production"},
+            json={**_REGISTER_BOT_A, "name": "Bot A Again"},
+            headers=ADMIN_HEADERS,
         )
         assert resp.status_code == 409
 
@@ -134,179 +222,106 @@ class TestAdminEndpoint:
 class TestAuthProtection:
     """Tests that protected endpoints require valid auth."""
 
-    @pytest.fixture
-    def client(self, tmp_path):
-        """Create a test client with a temporary token store."""
-        import auth
-        import config
-        old_tokens_file = config.TOKENS_FILE
-        config.TOKENS_FILE = str(tmp_path / "tokens.json")
-        auth.TOKENS_FILE = config.TOKENS_FILE
-
-        from main import app
-        load_tokens(config.TOKENS_FILE)
-        yield TestClient(app)
-
-        config.TOKENS_FILE = old_tokens_file
-        auth.TOKENS_FILE = old_tokens_file
-
-    def _register_and_get_key(self, client) -> str:
-        resp = client.post(
-            "/admin/register",
-            json={"owner_id": "tester", "name": "Tester"},
-            headers={"X-Admin-Secret": "change-me-in-production"},
-        )
-        return resp.json()["api_key"]
-
-    def test_join_requires_auth(self, client):
-        resp = client.post(
-            "/game/join",
-            json={"name": "Test", "max_hp": 20, "armor_class": 15},
-        )
+    @pytest.mark.parametrize("method,path,body", [
+        ("POST", "/game/join", {**_BASE_CHAR, "name": "Test"}),
+        ("GET", "/game/state", None),
+        ("POST", "/game/action", {"action_type": "end_turn"}),
+        ("POST", "/game/start", None),
+    ])
+    def test_endpoint_requires_auth(self, tokens_client, method, path, body):
+        resp = tokens_client.request(method, path, json=body)
         assert resp.status_code == 401
 
-    def test_join_rejects_bad_token(self, client):
-        resp = client.post(
+    def test_join_rejects_bad_token(self, tokens_client):
+        resp = tokens_client.post(
             "/game/join",
-            json={"name": "Test", "max_hp": 20, "armor_class": 15},
-            headers={"Authorization": "Bearer sk_badtoken"},
+            json={**_BASE_CHAR, "name": "Test"},
+            headers=_auth("sk_badtoken"),
         )
         assert resp.status_code == 401
 
-    def test_join_with_valid_token(self, client):
-        key = self._register_and_get_key(client)
-        resp = client.post(
+    def test_join_with_valid_token(self, tokens_client):
+        key = _fast_register("tester", "Tester")
+        resp = tokens_client.post(
             "/game/join",
-            json={
-                "name": "Test Fighter",
-                "max_hp": 20,
-                "armor_class": 15,
-                "attacks": [{
-                    "name": "Sword",
-                    "attack_bonus": 5,
-                    "damage_dice": "1d8",
-                    "damage_bonus": 3,
-                    "damage_type": "slashing",
-                }],
-            },
-            headers={"Authorization": f"Bearer {key}"},
+            json={**_BASE_CHAR, "name": "Test Fighter"},
+            headers=_auth(key),
         )
         assert resp.status_code == 200
         assert "character_id" in resp.json()
 
-    def test_state_requires_auth(self, client):
-        resp = client.get("/game/state")
-        assert resp.status_code == 401
+    @pytest.mark.parametrize("path", ["/", "/health", "/game", "/game/log", "/game/history"])
+    def test_public_endpoints_no_auth(self, tokens_client, path):
+        """Public endpoints should work without auth."""
+        assert tokens_client.get(path).status_code == 200
 
-    def test_action_requires_auth(self, client):
-        resp = client.post(
-            "/game/action",
-            json={"action_type": "end_turn"},
-        )
-        assert resp.status_code == 401
 
-    def test_start_requires_auth(self, client):
-        resp = client.post("/game/start")
-        assert resp.status_code == 401
+_OWNERSHIP_USERS = {"user_a": "User A", "user_b": "User B"}
 
-    def test_public_endpoints_no_auth(self, client):
-        """Public endpoints should work without auth."""
-        assert client.get("/").status_code == 200
-        assert client.get("/health").status_code == 200
-        assert client.get("/game").status_code == 200
-        assert client.get("/game/log").status_code == 200
-        assert client.get("/game/history").status_code == 200
 
+@pytest.fixture(scope="session")
+def registered_keys() -> dict[str, str]:
+    """API keys for user_a and user_b, minted once per session."""
+    return {owner_id: "sk_" + auth._token_generator() for owner_id in _OWNERSHIP_USERS}
 
-class TestOwnershipEnforcement:
-    """Tests that users can only act on their own characters."""
 
-    @pytest.fixture
-    def setup(self, tmp_path):
-        """Set up two registered users with characters."""
-        import auth
-        import config
-        old_tokens_file = config.TOKENS_FILE
-        config.TOKENS_FILE = str(tmp_path / "tokens.json")
-        auth.TOKENS_FILE = config.TOKENS_FILE
-
-        from main import app
-        load_tokens(config.TOKENS_FILE)
-        client = TestClient(app)
-
-        # Register two users
-        resp = client.post(
-            "/admin/register",
-            json={"owner_id": "user_a", "name": "User A"},
-            headers={"X-Admin-Secret": "change-me-in-production"},
-        )
-        key_a = resp.json()["api_key"]
+@dataclass(frozen=True, slots=True)
+class OwnershipSetup:
+    """Two registered users, each with a character in a pickled game."""
 
-        resp = client.post(
-            "/admin/register",
-            json={"owner_id": "user_b", "name": "User B"},
-            headers={"X-Admin-Secret": "change-me-in-production"},
-        )
-        key_b = resp.json()["api_key"]
-
-        char_data = {
-            "name": "Fighter",
-            "max_hp": 20,
-            "armor_class": 15,
-            "attacks": [{
-                "name": "Sword",
-                "attack_bonus": 5,
-                "damage_dice": "1d8",
-                "damage_bonus": 3,
-                "damage_type": "slashing",
-            }],
-        }
-
-        # Join characters
-        resp = client.post(
-            "/game/join",
-            json={**char_data, "name": "Fighter A"},
-            headers={"Authorization": f"Bearer {key_a}"},
-        )
-        char_a_id = resp.json()["character_id"]
+    client: TestClient
+    key_a: str
+    key_b: str
+    char_a_id: str
+    char_b_id: str
+    game: bytes
 
-        resp = client.post(
-            "/game/join",
-            json={**char_data, "name": "Fighter B"},
-            headers={"Authorization": f"Bearer {key_b}"},
-        )
-        char_b_id = resp.json()["character_id"]
 
-        yield {
-            "client": client,
-            "key_a": key_a,
-            "key_b": key_b,
-            "char_a_id": char_a_id,
-            "char_b_id": char_b_id,
-        }
+@pytest.fixture(scope="class")
+def _ownership_setup(base_client, _initial_game, registered_keys) -> OwnershipSetup:
+    """Join both users' characters once per class."""
+    game = pickle.loads(_initial_game)
+    app = SimpleNamespace(state=SimpleNamespace(game=game))
+    return OwnershipSetup(
+        client=base_client,
+        key_a=registered_keys["user_a"],
+        key_b=registered_keys["user_b"],
+        char_a_id=_fast_join(app, "user_a", "Fighter A"),
+        char_b_id=_fast_join(app, "user_b", "Fighter B"),
+        game=pickle.dumps(game),
+    )
 
-        config.TOKENS_FILE = old_tokens_file
-        auth.TOKENS_FILE = old_tokens_file
+
+class TestOwnershipEnforcement:
+    """Tests that users can only act on their own characters."""
+
+    @pytest.fixture
+    def setup(self, _ownership_setup, tokens_client, registered_keys):
+        """Restore the two registered users and their characters."""
+        auth._set_tokens({
+            key: User(owner_id=owner_id, name=_OWNERSHIP_USERS[owner_id])
+            for owner_id, key in registered_keys.items()
+        })
+        tokens_client.app.state.game = pickle.loads(_ownership_setup.game)
+        return _ownership_setup
 
     def test_state_returns_own_character(self, setup):
         """GET /game/state returns the character belonging to the token owner."""
-        client = setup["client"]
-        resp = client.get(
+        resp = setup.client.get(
             "/game/state",
-            headers={"Authorization": f"Bearer {setup['key_a']}"},
+            headers=_auth(setup.key_a),
         )
         assert resp.status_code == 200
-        assert resp.json()["your_character"]["id"] == setup["char_a_id"]
+        assert resp.json()["your_character"]["id"] == setup.char_a_id
 
     def test_state_different_user_sees_own_char(self, setup):
         """Each user sees their own character via /game/state."""
-        client = setup["client"]
-        resp = client.get(
+        resp = setup.client.get(
             "/game/state",
-            headers={"Authorization": f"Bearer {setup['key_b']}"},
+            headers=_auth(setup.key_b),
         )
         assert resp.status_code == 200
-        assert resp.json()["your_character"]["id"] == setup["char_b_id"]
+        assert resp.json()["your_character"]["id"] == setup.char_b_id
 
 
 class TestTokenHelpers:
@@ -320,6 +335,7 @@ class TestTokenHelpers:
     def test_delete_token_not_found(self):
         assert delete_token("nonexistent") is False
 
+    @pytest.mark.real_fs
     def test_delete_token_persists(self, tmp_path):
         path = str(tmp_path / "tokens.json")
         load_tokens(path)
@@ -343,6 +359,7 @@ class TestTokenHelpers:
     def test_update_user_not_found(self):
         assert update_user("nonexistent", "Name") is False
 
+    @pytest.mark.real_fs
     def test_update_user_persists(self, tmp_path):
         path = str(tmp_path / "tokens.json")
         load_tokens(path)
@@ -381,6 +398,7 @@ class TestTokenHelpers:
         rotate_token("bot_a")
         assert get_user_by_token(old_key) is None
 
+    @pytest.mark.real_fs
     def test_rotate_token_persists(self, tmp_path):
         path = str(tmp_path / "tokens.json")
         load_tokens(path)
@@ -395,227 +413,177 @@ class TestTokenHelpers:
         assert new_key in loaded
 
 
-ADMIN_HEADERS = {"X-Admin-Secret": "change-me-in-production"}
+@pytest.fixture(scope="class")
+def _base_tokens() -> dict[str, User]:
+    """Token store snapshot with bot_a registered, built once per class."""
+    return {"sk_" + auth._token_generator(): User(owner_id="bot_a", name="Bot A")}
 
 
 class TestAdminCRUD:
-    """Tests for the admin CRUD endpoints (get-token, edit, rotate, delete)."""
+    """Tests for the admin CRUD endpoints (get-token, edit, rotate, delete).
 
-    @pytest.fixture
-    def client(self, tmp_path):
-        """Create a test client with a temporary token store."""
-        import auth
-        import config
-        old_tokens_file = config.TOKENS_FILE
-        config.TOKENS_FILE = str(tmp_path / "tokens.json")
-        auth.TOKENS_FILE = config.TOKENS_FILE
-
-        from main import app
-        load_tokens(config.TOKENS_FILE)
-        yield TestClient(app)
-
-        config.TOKENS_FILE = old_tokens_file
-        auth.TOKENS_FILE = old_tokens_file
-
-    def _register(self, client, owner_id: str, name: str) -> str:
-        """Register a user and return the API key."""
-        resp = client.post(
-            "/admin/register",
-            json={"owner_id": owner_id, "name": name},
-            headers=ADMIN_HEADERS,
-        )
-        return resp.json()["api_key"]
+    Every test starts with bot_a already registered.
+    """
 
-    def _join(self, client, key: str, name: str = "Fighter") -> str:
-        """Join the game with a character and return the character_id."""
-        resp = client.post(
-            "/game/join",
-            json={
-                "name": name,
-                "max_hp": 20,
-                "armor_class": 15,
-                "attacks": [{
-                    "name": "Sword",
-                    "attack_bonus": 5,
-                    "damage_dice": "1d8",
-                    "damage_bonus": 3,
-                    "damage_type": "slashing",
-                }],
-            },
-            headers={"Authorization": f"Bearer {key}"},
-        )
-        return resp.json()["character_id"]
+    @pytest.fixture(autouse=True)
+    def _restore_base_tokens(self, _base_tokens, tokens_client):
+        auth._set_tokens(_base_tokens)
 
     # ── GET /admin/users/{owner_id}/token ──
 
-    def test_get_token_success(self, client):
-        key = self._register(client, "bot_a", "Bot A")
-        resp = client.get("/admin/users/bot_a/token", headers=ADMIN_HEADERS)
+    def test_get_token_success(self, tokens_client):
+        key = get_token_for_owner("bot_a")
+        resp = tokens_client.get("/admin/users/bot_a/token", headers=ADMIN_HEADERS)
         assert resp.status_code == 200
-        assert resp.json()["api_key"] == key
-        assert resp.json()["owner_id"] == "bot_a"
+        data = resp.json()
+        assert data["api_key"] == key
+        assert data["owner_id"] == "bot_a"
 
-    def test_get_token_not_found(self, client):
-        resp = client.get("/admin/users/nonexistent/token", headers=ADMIN_HEADERS)
+    def test_get_token_not_found(self, tokens_client):
+        resp = tokens_client.get("/admin/users/nonexistent/token", headers=ADMIN_HEADERS)
         assert resp.status_code == 404
 
-    def test_get_token_wrong_secret(self, client):
-        resp = client.get(
+    def test_get_token_wrong_secret(self, tokens_client):
+        resp = tokens_client.get(
             "/admin/users/bot_a/token",
-            headers={"X-Admin-Secret": "wrong"},
+            headers=_BAD_SECRET,
         )
         assert resp.status_code == 403
 
     # ── PATCH /admin/users/{owner_id} ──
 
-    def test_edit_user_success(self, client):
-        self._register(client, "bot_a", "Bot A")
-        resp = client.patch(
+    def test_edit_user_success(self, tokens_client):
+        resp = tokens_client.patch(
             "/admin/users/bot_a",
             json={"name": "New Name"},
             headers=ADMIN_HEADERS,
         )
         assert resp.status_code == 200
-        assert resp.json()["owner_id"] == "bot_a"
-        assert resp.json()["name"] == "New Name"
+        data = resp.json()
+        assert data["owner_id"] == "bot_a"
+        assert data["name"] == "New Name"
 
         # Verify it persisted to user list
-        users_resp = client.get("/admin/users", headers=ADMIN_HEADERS)
-        users = users_resp.json()
-        bot_a = next(u for u in users if u["owner_id"] == "bot_a")
-        assert bot_a["name"] == "New Name"
+        users_resp = tokens_client.get("/admin/users", headers=ADMIN_HEADERS)
+        names = {u["owner_id"]: u["name"] for u in users_resp.json()}
+        assert names["bot_a"] == "New Name"
 
-    def test_edit_user_not_found(self, client):
-        resp = client.patch(
+    def test_edit_user_not_found(self, tokens_client):
+        resp = tokens_client.patch(
             "/admin/users/nonexistent",
             json={"name": "Name"},
             headers=ADMIN_HEADERS,
         )
         assert resp.status_code == 404
 
-    def test_edit_user_wrong_secret(self, client):
-        resp = client.patch(
+    def test_edit_user_wrong_secret(self, tokens_client):
+        resp = tokens_client.patch(
             "/admin/users/bot_a",
             json={"name": "Name"},
-            headers={"X-Admin-Secret": "wrong"},
+            headers=_BAD_SECRET,
         )
         assert resp.status_code == 403
 
     # ── POST /admin/users/{owner_id}/rotate-token ──
 
-    def test_rotate_token_success(self, client):
-        old_key = self._register(client, "bot_a", "Bot A")
-        resp = client.post("/admin/users/bot_a/rotate-token", headers=ADMIN_HEADERS)
+    def test_rotate_token_success(self, tokens_client):
+        old_key = get_token_for_owner("bot_a")
+        resp = tokens_client.post("/admin/users/bot_a/rotate-token", headers=ADMIN_HEADERS)
         assert resp.status_code == 200
         new_key = resp.json()["api_key"]
         assert new_key != old_key
         assert new_key.startswith("sk_")
 
         # Old key should be rejected
-        resp2 = client.get(
+        resp2 = tokens_client.get(
             "/game/state",
-            headers={"Authorization": f"Bearer {old_key}"},
+            headers=_auth(old_key),
         )
         assert resp2.status_code == 401
 
         # New key should work
-        resp3 = client.get(
+        resp3 = tokens_client.get(
             "/game",
-            headers={"Authorization": f"Bearer {new_key}"},
+            headers=_auth(new_key),
         )
         assert resp3.status_code == 200
 
-    def test_rotate_token_not_found(self, client):
-        resp = client.post("/admin/users/nonexistent/rotate-token", headers=ADMIN_HEADERS)
+    def test_rotate_token_not_found(self, tokens_client):
+        resp = tokens_client.post("/admin/users/nonexistent/rotate-token", headers=ADMIN_HEADERS)
         assert resp.status_code == 404
 
-    def test_rotate_token_wrong_secret(self, client):
-        resp = client.post(
+    def test_rotate_token_wrong_secret(self, tokens_client):
+        resp = tokens_client.post(
             "/admin/users/bot_a/rotate-token",
-            headers={"X-Admin-Secret": "wrong"},
+            headers=_BAD_SECRET,
         )
         assert resp.status_code == 403
 
     # ── DELETE /admin/users/{owner_id} ──
 
-    def test_delete_user_success(self, client):
-        self._register(client, "bot_a", "Bot A")
-        resp = client.delete("/admin/users/bot_a", headers=ADMIN_HEADERS)
+    def test_delete_user_success(self, tokens_client):
+        resp = tokens_client.delete("/admin/users/bot_a", headers=ADMIN_HEADERS)
         assert resp.status_code == 200
         assert resp.json()["message"] == "User 'bot_a' deleted"
 
         # Verify user is gone from the list
-        users_resp = client.get("/admin/users", headers=ADMIN_HEADERS)
-        owner_ids = [u["owner_id"] for u in users_resp.json()]
+        users_resp = tokens_client.get("/admin/users", headers=ADMIN_HEADERS)
+        owner_ids = {u["owner_id"] for u in users_resp.json()}
         assert "bot_a" not in owner_ids
 
-    def test_delete_user_not_found(self, client):
-        resp = client.delete("/admin/users/nonexistent", headers=ADMIN_HEADERS)
+    def test_delete_user_not_found(self, tokens_client):
+        resp = tokens_client.delete("/admin/users/nonexistent", headers=ADMIN_HEADERS)
         assert resp.status_code == 404
 
-    def test_delete_user_wrong_secret(self, client):
-        resp = client.delete(
+    def test_delete_user_wrong_secret(self, tokens_client):
+        resp = tokens_client.delete(
             "/admin/users/bot_a",
-            headers={"X-Admin-Secret": "wrong"},
+            headers=_BAD_SECRET,
         )
         assert resp.status_code == 403
 
-    def test_delete_user_with_no_character(self, client):
+    def test_delete_user_with_no_character(self, tokens_client):
         """Deleting a user who never joined should report character_removed=false."""
-        self._register(client, "bot_a", "Bot A")
-        resp = client.delete("/admin/users/bot_a", headers=ADMIN_HEADERS)
+        resp = tokens_client.delete("/admin/users/bot_a", headers=ADMIN_HEADERS)
         assert resp.status_code == 200
         assert resp.json()["character_removed"] is False
 
-    def test_delete_user_removes_character(self, client):
+    def test_delete_user_removes_character(self, app, tokens_client):
         """Deleting a user should remove their character from the game."""
-        key = self._register(client, "bot_a", "Bot A")
-        self._join(client, key, "Fighter A")
+        _fast_join(app, "bot_a", "Fighter A")
 
         # Confirm character is in the game
-        game = client.get("/game").json()
+        game = tokens_client.get("/game").json()
         assert any(c["name"] == "Fighter A" for c in game["characters"])
 
-        resp = client.delete("/admin/users/bot_a", headers=ADMIN_HEADERS)
+        resp = tokens_client.delete("/admin/users/bot_a", headers=ADMIN_HEADERS)
         assert resp.status_code == 200
         assert resp.json()["character_removed"] is True
 
         # Character should be gone
-        game = client.get("/game").json()
+        game = tokens_client.get("/game").json()
         assert not any(c.get("owner_id") == "bot_a" for c in game["characters"])
 
-    def test_delete_user_token_invalidated(self, client):
+    def test_delete_user_token_invalidated(self, tokens_client):
         """After deleting a user, their API key should be rejected."""
-        key = self._register(client, "bot_a", "Bot A")
-        client.delete("/admin/users/bot_a", headers=ADMIN_HEADERS)
+        key = get_token_for_owner("bot_a")
+        tokens_client.delete("/admin/users/bot_a", headers=ADMIN_HEADERS)
 
-        resp = client.get(
+        resp = tokens_client.get(
             "/game/state",
-            headers={"Authorization": f"Bearer {key}"},
+            headers=_auth(key),
         )
         assert resp.status_code == 401
 
-    def test_rotate_then_join(self, client):
+    def test_rotate_then_join(self, tokens_client):
         """After rotating a key, the new key should work for joining."""
-        self._register(client, "bot_a", "Bot A")
-        resp = client.post("/admin/users/bot_a/rotate-token", headers=ADMIN_HEADERS)
+        resp = tokens_client.post("/admin/users/bot_a/rotate-token", headers=ADMIN_HEADERS)
         new_key = resp.json()["api_key"]
 
-        join_resp = client.post(
+        join_resp = tokens_client.post(
             "/game/join",
-            json={
-                "name": "Rotated Fighter",
-                "max_hp": 20,
-                "armor_class": 15,
-                "attacks": [{
-                    "name": "Sword",
-                    "attack_bonus": 5,
-                    "damage_dice": "1d8",
-                    "damage_bonus": 3,
-                    "damage_type": "slashing",
-                }],
-            },
-            headers={"Authorization": f"Bearer {new_key}"},
+            json={**_BASE_CHAR, "name": "Rotated Fighter"},
+            headers=_auth(new_key),
         )
         assert join_resp.status_code == 200
         assert "character_id" in join_resp.json()
@@ -1,7 +1,7 @@
 """Tests for combat orchestration: initiative, turns, win conditions."""
 
-import os
-import tempfile
+import pickle
+from typing import Final
 
 import pytest
 
@@ -19,37 +19,47 @@ from engine.combat import (
     transition_to_waiting,
 )
 from models.actions import ActionRequest, ActionType
-from models.characters import AbilityScores, Attack, Character
-from models.game_state import GameStatus
-
-
-def _make_character(
-    char_id: str,
-    owner_id: str,
-    hp: int = 20,
-    dex: int = 14,
-) -> Character:
-    """Helper to create a test character."""
-    return Character(
-        id=char_id,
-        name=f"Char_{char_id}",
-        owner_id=owner_id,
-        ability_scores=AbilityScores(dexterity=dex),
-        max_hp=hp,
-        current_hp=hp,
-        armor_class=15,
-        speed=30,
-        attacks=[
-            Attack(
-                name="Sword",
-                attack_bonus=5,
-                damage_dice="1d8",
-                damage_bonus=3,
-                damage_type="slashing",
-                reach=5,
-            )
-        ],
-    )
+from models.game_state import GameState, GameStatus
+from tests._factories import make_character
+from tests.conftest import _TEST_GRID_SIZE
+
+
+def _two_char_blob() -> bytes:
+    """Pickle a two-character game (c1 at (1, 1), c2 at (3, 3))."""
+    gs = create_game("game1", width=_TEST_GRID_SIZE, height=_TEST_GRID_SIZE)
+    add_character(gs, make_character("c1", "owner1"), (1, 1))
+    add_character(gs, make_character("c2", "owner2"), (3, 3))
+    return pickle.dumps(gs)
+
+
+# Only the pickled bytes are kept, so no test can mutate the prototype
+_PROTO_PICKLE: Final = _two_char_blob()
+
+
+@pytest.fixture
+def two_char_game() -> GameState:
+    """A fresh copy of the two-character prototype game."""
+    return pickle.loads(_PROTO_PICKLE)
+
+
+@pytest.fixture(scope="session")
+def saved_game_path(tmp_path_factory) -> str:
+    """The prototype game, renamed "Test Arena" and saved once per session.
+
+    load_game never writes, so tests can share the file.
+    """
+    gs = pickle.loads(_PROTO_PICKLE)
+    gs.name = "Test Arena"
+    path = str(tmp_path_factory.mktemp("saves") / "test_save.json")
+    save_game(gs, path)
+    return path
+
+
+@pytest.fixture
+def two_player_combat(two_char_game) -> GameState:
+    """The two-character game with combat already started."""
+    start_combat(two_char_game)
+    return two_char_game
 
 
 class TestCreateGame:
@@ -65,6 +75,11 @@ class TestCreateGame:
         assert len(gs.grid) > 0
         assert len(gs.grid[0]) > 0
 
+    def test_custom_grid_size(self):
+        gs = create_game("game1", width=12, height=8)
+        assert len(gs.grid) == 8
+        assert len(gs.grid[0]) == 12
+
     def test_empty_characters(self):
         gs = create_game("game1")
         assert len(gs.characters) == 0
@@ -73,25 +88,22 @@ class TestCreateGame:
 class TestAddCharacter:
     """Tests for add_character()."""
 
-    def test_add_character(self):
-        gs = create_game("game1")
-        char = _make_character("c1", "owner1")
+    def test_add_character(self, gs):
+        char = make_character("c1", "owner1")
         add_character(gs, char, (5, 5))
         assert "c1" in gs.characters
         assert gs.characters["c1"].position == (5, 5)
         assert gs.grid[5][5].occupant_id == "c1"
 
-    def test_add_to_occupied_fails(self):
-        gs = create_game("game1")
-        char1 = _make_character("c1", "owner1")
-        char2 = _make_character("c2", "owner2")
+    def test_add_to_occupied_fails(self, gs):
+        char1 = make_character("c1", "owner1")
+        char2 = make_character("c2", "owner2")
         add_character(gs, char1, (5, 5))
         with pytest.raises(ValueError, match="occupied"):
             add_character(gs, char2, (5, 5))
 
-    def test_add_out_of_bounds_fails(self):
-        gs = create_game("game1")
-        char = _make_character("c1", "owner1")
+    def test_add_out_of_bounds_fails(self, gs):
+        char = make_character("c1", "owner1")
         with pytest.raises(ValueError, match="out of bounds"):
             add_character(gs, char, (100, 100))
 
@@ -99,71 +111,44 @@ class TestAddCharacter:
 class TestStartCombat:
     """Tests for start_combat()."""
 
-    def test_start_sets_active(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_start_sets_active(self, two_player_combat):
+        gs = two_player_combat
         assert gs.status == GameStatus.ACTIVE
 
-    def test_initiative_order_set(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_initiative_order_set(self, two_player_combat):
+        gs = two_player_combat
         assert len(gs.initiative_order) == 2
         assert set(gs.initiative_order) == {"c1", "c2"}
 
-    def test_start_with_one_char_fails(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
+    def test_start_with_one_char_fails(self, gs):
+        c1 = make_character("c1", "owner1")
         add_character(gs, c1, (1, 1))
         with pytest.raises(ValueError, match="at least 2"):
             start_combat(gs)
 
-    def test_turn_deadline_set(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_turn_deadline_set(self, two_player_combat):
+        gs = two_player_combat
         assert gs.turn_deadline is not None
 
 
 class TestGetCurrentTurnCharacter:
     """Tests for get_current_turn_character()."""
 
-    def test_returns_first_in_initiative(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_returns_first_in_initiative(self, two_player_combat):
+        gs = two_player_combat
         current = get_current_turn_character(gs)
         assert current is not None
         assert current.id == gs.initiative_order[0]
 
-    def test_returns_none_if_waiting(self):
-        gs = create_game("game1")
+    def test_returns_none_if_waiting(self, gs):
         assert get_current_turn_character(gs) is None
 
 
 class TestAdvanceTurn:
     """Tests for advance_turn()."""
 
-    def test_advances_to_next(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_advances_to_next(self, two_player_combat):
+        gs = two_player_combat
 
         first_id = gs.initiative_order[0]
         advance_turn(gs)
@@ -171,26 +156,16 @@ class TestAdvanceTurn:
         assert current is not None
         assert current.id != first_id
 
-    def test_round_increments_on_wrap(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_round_increments_on_wrap(self, two_player_combat):
+        gs = two_player_combat
         assert gs.round_number == 1
         advance_turn(gs)  # Turn 2
         advance_turn(gs)  # Back to turn 1 -> round 2
         assert gs.round_number == 2
 
-    def test_skips_dead_characters(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        c3 = _make_character("c3", "owner1")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        add_character(gs, c3, (5, 5))
+    def test_skips_dead_characters(self, two_char_game):
+        gs = two_char_game
+        add_character(gs, make_character("c3", "owner1"), (5, 5))
         start_combat(gs)
 
         # Kill the second character in initiative order
@@ -208,45 +183,24 @@ class TestAdvanceTurn:
 class TestCheckWinCondition:
     """Tests for check_win_condition()."""
 
-    def test_no_winner_both_alive(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        assert check_win_condition(gs) is None
-
-    def test_winner_when_one_team_dead(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        gs.characters["c2"].is_alive = False
-        gs.characters["c2"].current_hp = 0
-        assert check_win_condition(gs) == "owner1"
-
-    def test_no_winner_all_dead(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        gs.characters["c1"].is_alive = False
-        gs.characters["c2"].is_alive = False
-        assert check_win_condition(gs) is None
+    @pytest.mark.parametrize("dead,winner", [
+        ((), None),                 # both alive
+        (("c2",), "owner1"),        # one team wiped out
+        (("c1", "c2"), None),       # everyone dead
+    ])
+    def test_win_condition(self, two_char_game, dead, winner):
+        gs = two_char_game
+        for char_id in dead:
+            gs.characters[char_id].is_alive = False
+            gs.characters[char_id].current_hp = 0
+        assert check_win_condition(gs) == winner
 
 
 class TestProcessAction:
     """Tests for process_action()."""
 
-    def test_end_turn_advances(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_end_turn_advances(self, two_player_combat):
+        gs = two_player_combat
 
         current_id = get_current_turn_character(gs).id
         action = ActionRequest(
@@ -257,13 +211,8 @@ class TestProcessAction:
         assert result.success
         assert get_current_turn_character(gs).id != current_id
 
-    def test_wrong_turn_fails(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_wrong_turn_fails(self, two_player_combat):
+        gs = two_player_combat
 
         current_id = get_current_turn_character(gs).id
         other_id = "c1" if current_id == "c2" else "c2"
@@ -275,10 +224,22 @@ class TestProcessAction:
         assert not result.success
         assert "not your turn" in result.error.lower()
 
-    def test_move_action(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
+    def test_invalid_action_reports_message(self, two_player_combat):
+        gs = two_player_combat
+
+        current_id = get_current_turn_character(gs).id
+        action = ActionRequest(
+            character_id=current_id,
+            action_type=ActionType.ATTACK,
+        )
+        _, result = process_action(gs, current_id, action)
+        assert not result.success
+        assert result.error == "Attack action requires a target_id"
+        assert result.description == "Attack action requires a target_id"
+
+    def test_move_action(self, gs):
+        c1 = make_character("c1", "owner1")
+        c2 = make_character("c2", "owner2")
         add_character(gs, c1, (1, 1))
         add_character(gs, c2, (8, 8))
         start_combat(gs)
@@ -300,16 +261,8 @@ class TestProcessAction:
 class TestSaveAndLoadGame:
     """Tests for save_game() and load_game()."""
 
-    def test_save_and_load_roundtrip(self, tmp_path):
-        path = str(tmp_path / "test_save.json")
-        gs = create_game("game1", name="Test Arena")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-
-        save_game(gs, path)
-        loaded = load_game(path)
+    def test_save_and_load_roundtrip(self, saved_game_path):
+        loaded = load_game(saved_game_path)
 
         assert loaded is not None
         assert loaded.game_id == "game1"
@@ -323,14 +276,9 @@ class TestSaveAndLoadGame:
         path = str(tmp_path / "does_not_exist.json")
         assert load_game(path) is None
 
-    def test_save_preserves_active_state(self, tmp_path):
+    def test_save_preserves_active_state(self, tmp_path, two_player_combat):
         path = str(tmp_path / "active_save.json")
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+        gs = two_player_combat
 
         save_game(gs, path)
         loaded = load_game(path)
@@ -343,12 +291,8 @@ class TestSaveAndLoadGame:
 class TestRemoveDeadCharacters:
     """Tests for remove_dead_characters()."""
 
-    def test_removes_dead_keeps_alive(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
+    def test_removes_dead_keeps_alive(self, two_char_game):
+        gs = two_char_game
         gs.characters["c2"].is_alive = False
         gs.characters["c2"].current_hp = 0
 
@@ -358,18 +302,16 @@ class TestRemoveDeadCharacters:
         assert "c2" not in gs.characters
         assert gs.grid[3][3].occupant_id is None
 
-    def test_clears_grid_occupant(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
+    def test_clears_grid_occupant(self, gs):
+        c1 = make_character("c1", "owner1")
         add_character(gs, c1, (5, 5))
         gs.characters["c1"].is_alive = False
 
         remove_dead_characters(gs)
         assert gs.grid[5][5].occupant_id is None
 
-    def test_no_dead_is_noop(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
+    def test_no_dead_is_noop(self, gs):
+        c1 = make_character("c1", "owner1")
         add_character(gs, c1, (1, 1))
 
         remove_dead_characters(gs)
@@ -379,13 +321,8 @@ class TestRemoveDeadCharacters:
 class TestTransitionToWaiting:
     """Tests for transition_to_waiting()."""
 
-    def test_resets_to_waiting(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_resets_to_waiting(self, two_player_combat):
+        gs = two_player_combat
 
         # Simulate game completion
         gs.characters["c2"].is_alive = False
@@ -401,13 +338,8 @@ class TestTransitionToWaiting:
         assert gs.round_number == 1
         assert gs.event_log == []
 
-    def test_removes_dead_keeps_survivors(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1")
-        c2 = _make_character("c2", "owner2")
-        add_character(gs, c1, (1, 1))
-        add_character(gs, c2, (3, 3))
-        start_combat(gs)
+    def test_removes_dead_keeps_survivors(self, two_player_combat):
+        gs = two_player_combat
 
         gs.characters["c2"].is_alive = False
         gs.characters["c2"].current_hp = 0
@@ -419,10 +351,9 @@ class TestTransitionToWaiting:
         assert "c2" not in gs.characters
         assert gs.characters["c1"].is_alive
 
-    def test_survivors_keep_current_hp(self):
-        gs = create_game("game1")
-        c1 = _make_character("c1", "owner1", hp=50)
-        c2 = _make_character("c2", "owner2")
+    def test_survivors_keep_current_hp(self, gs):
+        c1 = make_character("c1", "owner1", hp=50)
+        c2 = make_character("c2", "owner2")
         add_character(gs, c1, (1, 1))
         add_character(gs, c2, (3, 3))
         start_combat(gs)
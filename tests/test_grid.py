@@ -1,41 +1,20 @@
 """Tests for grid, movement, distance, and line-of-sight logic."""
 
+import itertools
+
 import pytest
 
-from config import SQUARE_SIZE_FT
+import engine.grid
 from engine.grid import (
+    _py_distance,
+    _py_line_of_sight,
     create_grid,
-    distance,
     get_valid_moves,
     is_adjacent,
-    line_of_sight,
     move_character,
 )
-from models.characters import AbilityScores, Attack, Character
 from models.game_state import GameState, GridCell
-
-
-def _make_character(char_id: str = "c1", position: tuple[int, int] | None = None) -> Character:
-    """Helper to create a test character."""
-    return Character(
-        id=char_id,
-        name="Test",
-        owner_id="owner1",
-        max_hp=20,
-        current_hp=20,
-        armor_class=15,
-        speed=30,
-        position=position,
-        attacks=[
-            Attack(
-                name="Sword",
-                attack_bonus=5,
-                damage_dice="1d8",
-                damage_bonus=3,
-                damage_type="slashing",
-            )
-        ],
-    )
+from tests._factories import make_character
 
 
 def _make_game_state(width: int = 10, height: int = 10) -> GameState:
@@ -69,19 +48,19 @@ class TestDistance:
     """Tests for distance()."""
 
     def test_same_position(self):
-        assert distance((0, 0), (0, 0)) == 0
+        assert _py_distance((0, 0), (0, 0)) == 0
 
     def test_cardinal_distance(self):
-        assert distance((0, 0), (3, 0)) == 15  # 3 squares * 5ft
-        assert distance((0, 0), (0, 4)) == 20  # 4 squares * 5ft
+        assert _py_distance((0, 0), (3, 0)) == 15  # 3 squares * 5ft
+        assert _py_distance((0, 0), (0, 4)) == 20  # 4 squares * 5ft
 
     def test_diagonal_distance(self):
         """Diagonal uses Chebyshev distance (max of dx, dy)."""
-        assert distance((0, 0), (3, 3)) == 15  # max(3,3) * 5 = 15
-        assert distance((0, 0), (2, 4)) == 20  # max(2,4) * 5 = 20
+        assert _py_distance((0, 0), (3, 3)) == 15  # max(3,3) * 5 = 15
+        assert _py_distance((0, 0), (2, 4)) == 20  # max(2,4) * 5 = 20
 
     def test_symmetric(self):
-        assert distance((1, 2), (4, 6)) == distance((4, 6), (1, 2))
+        assert _py_distance((1, 2), (4, 6)) == _py_distance((4, 6), (1, 2))
 
 
 class TestIsAdjacent:
@@ -109,7 +88,7 @@ class TestGetValidMoves:
     def test_center_movement(self):
         """Character in center of open grid can reach many squares."""
         game_state = _make_game_state(10, 10)
-        char = _make_character(position=(5, 5))
+        char = make_character(position=(5, 5))
         moves = get_valid_moves(char, game_state.grid)
         assert len(moves) > 0
         # With speed 30 (6 squares), should reach up to 6 squares away
@@ -122,7 +101,7 @@ class TestGetValidMoves:
         # Build a wall across row 2
         for x in range(5):
             game_state.grid[2][x].terrain = "wall"
-        char = _make_character(position=(2, 0))
+        char = make_character(position=(2, 0))
         moves = get_valid_moves(char, game_state.grid)
         # Should not be able to reach anything below the wall
         for pos in moves:
@@ -131,7 +110,7 @@ class TestGetValidMoves:
     def test_no_position_returns_empty(self):
         """Character with no position gets no valid moves."""
         game_state = _make_game_state()
-        char = _make_character(position=None)
+        char = make_character(position=None)
         moves = get_valid_moves(char, game_state.grid)
         assert moves == []
 
@@ -139,7 +118,8 @@ class TestGetValidMoves:
         """Can't move through occupied squares."""
         game_state = _make_game_state(5, 5)
         game_state.grid[1][2].occupant_id = "blocker"
-        char = _make_character(position=(2, 0))
+        char = make_character(position=(2, 0))
+        char.speed = 10  # the blocker is one square away
         moves = get_valid_moves(char, game_state.grid)
         assert (2, 1) not in moves
 
@@ -150,7 +130,7 @@ class TestMoveCharacter:
     def test_basic_move(self):
         """Move a character to an adjacent square."""
         game_state = _make_game_state(5, 5)
-        char = _make_character(char_id="c1", position=(2, 2))
+        char = make_character(char_id="c1", position=(2, 2))
         game_state.characters["c1"] = char
         game_state.grid[2][2].occupant_id = "c1"
 
@@ -164,7 +144,7 @@ class TestMoveCharacter:
         """Moving into a wall raises ValueError."""
         game_state = _make_game_state(5, 5)
         game_state.grid[3][3].terrain = "wall"
-        char = _make_character(char_id="c1", position=(2, 3))
+        char = make_character(char_id="c1", position=(2, 3))
         game_state.characters["c1"] = char
         game_state.grid[3][2].occupant_id = "c1"
 
@@ -174,7 +154,7 @@ class TestMoveCharacter:
     def test_move_out_of_bounds_fails(self):
         """Moving out of bounds raises ValueError."""
         game_state = _make_game_state(5, 5)
-        char = _make_character(char_id="c1", position=(4, 4))
+        char = make_character(char_id="c1", position=(4, 4))
         game_state.characters["c1"] = char
         game_state.grid[4][4].occupant_id = "c1"
 
@@ -183,26 +163,61 @@ class TestMoveCharacter:
 
 
 class TestLineOfSight:
-    """Tests for line_of_sight()."""
+    """Tests for _py_line_of_sight()."""
 
     def test_clear_los(self):
         """Clear line of sight on open grid."""
         grid = create_grid(10, 10)
-        assert line_of_sight((0, 0), (9, 9), grid)
+        assert _py_line_of_sight((0, 0), (9, 9), grid)
 
     def test_wall_blocks_los(self):
         """Wall between two points blocks LoS."""
         grid = create_grid(10, 10)
         # Place a wall at (5, 5)
         grid[5][5].terrain = "wall"
-        assert not line_of_sight((0, 0), (9, 9), grid)
+        assert not _py_line_of_sight((0, 0), (9, 9), grid)
 
     def test_adjacent_always_visible(self):
         """Adjacent squares always have LoS."""
         grid = create_grid(5, 5)
-        assert line_of_sight((2, 2), (3, 3), grid)
+        assert _py_line_of_sight((2, 2), (3, 3), grid)
 
     def test_same_position(self):
         """Same position has LoS."""
         grid = create_grid(5, 5)
-        assert line_of_sight((2, 2), (2, 2), grid)
+        assert _py_line_of_sight((2, 2), (2, 2), grid)
+
+
+# Differential-test board: walls on a corner, an edge and the interior
+_DIFF_SIZE = 6
+_DIFF_WALLS = [(0, 0), (3, 1), (5, 2), (2, 3), (4, 4)]
+_ALL_POSITIONS = list(itertools.product(range(_DIFF_SIZE), repeat=2))
+
+
+class TestCompiledGrid:
+    """Tests for the optional Cython versions, checked against the Python reference."""
+
+    @pytest.fixture
+    def grid_c(self):
+        return pytest.importorskip("engine._grid_c")
+
+    def test_public_names_use_compiled(self, grid_c):
+        assert engine.grid.distance is grid_c.distance
+        assert engine.grid.line_of_sight is grid_c.line_of_sight
+
+    def test_distance_matches(self, grid_c):
+        for a, b in itertools.product(_ALL_POSITIONS, repeat=2):
+            assert grid_c.distance(a, b) == _py_distance(a, b), (a, b)
+
+    def test_line_of_sight_matches(self, grid_c):
+        grid = create_grid(_DIFF_SIZE, _DIFF_SIZE)
+        for x, y in _DIFF_WALLS:
+            grid[y][x].terrain = "wall"
+        for a, b in itertools.product(_ALL_POSITIONS, repeat=2):
+            assert grid_c.line_of_sight(a, b, grid) == _py_line_of_sight(a, b, grid), (a, b)
+
+    def test_endpoints_do_not_block(self, grid_c):
+        grid = create_grid(5, 5)
+        grid[0][0].terrain = "wall"
+        grid[4][4].terrain = "wall"
+        assert grid_c.line_of_sight((0, 0), (4, 4), grid)
@@ -0,0 +1,51 @@
+"""Tests for server startup: loading or creating the singleton game."""
+
+import pytest
+
+import main
+from config import GAME_ID
+from engine.combat import add_character, load_game, save_game
+from engine.npc import GOLEM_NAME
+from models.game_state import GameState, GameStatus
+from tests._factories import make_character
+
+
+@pytest.fixture
+def save_file(tmp_path, monkeypatch) -> str:
+    """Point main's save file at a per-test path that does not exist yet."""
+    path = str(tmp_path / "game_state.json")
+    monkeypatch.setattr(main, "SAVE_FILE", path)
+    return path
+
+
+def _npc_names(game: GameState) -> list[str]:
+    return [c.name for c in game.characters.values() if c.is_npc]
+
+
+class TestInitGame:
+    """Tests for _init_game()."""
+
+    def test_missing_save_creates_game(self, save_file):
+        game = main._init_game()
+        assert game.game_id == GAME_ID
+        assert game.status == GameStatus.WAITING
+        assert _npc_names(game) == [GOLEM_NAME]
+        # NPCs are spawned before the first save
+        saved = load_game(save_file)
+        assert saved is not None
+        assert _npc_names(saved) == [GOLEM_NAME]
+
+    def test_completed_save_returns_to_waiting(self, save_file, gs):
+        add_character(gs, make_character("c1", "owner1"), (1, 1))
+        add_character(gs, make_character("c2", "owner2"), (3, 3))
+        gs.characters["c2"].is_alive = False
+        gs.characters["c2"].current_hp = 0
+        gs.status = GameStatus.COMPLETED
+        save_game(gs, save_file)
+
+        game = main._init_game()
+        assert game.status == GameStatus.WAITING
+        assert "c1" in game.characters
+        assert "c2" not in game.characters
+        assert GOLEM_NAME in _npc_names(game)
+        assert load_game(save_file).status == GameStatus.WAITING
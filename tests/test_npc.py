@@ -1,5 +1,9 @@
 """Tests for NPC spawning, GOLEM AI, and integration with the combat loop."""
 
+import pickle
+from typing import Final
+from uuid import uuid4
+
 import pytest
 
 from engine.combat import (
@@ -20,38 +24,35 @@ from engine.npc import (
     golem_center_position,
     resolve_npc_turn,
 )
+from engine.rules import apply_damage
 from models.actions import ActionRequest, ActionType
-from models.characters import AbilityScores, Attack, Character
-from models.game_state import GameStatus
-
-
-def _make_player(
-    char_id: str,
-    owner_id: str,
-    hp: int = 20,
-    dex: int = 14,
-) -> Character:
-    """Helper to create a test player character."""
-    return Character(
-        id=char_id,
-        name=f"Player_{char_id}",
-        owner_id=owner_id,
-        ability_scores=AbilityScores(dexterity=dex),
-        max_hp=hp,
-        current_hp=hp,
-        armor_class=15,
-        speed=30,
-        attacks=[
-            Attack(
-                name="Sword",
-                attack_bonus=5,
-                damage_dice="1d8",
-                damage_bonus=3,
-                damage_type="slashing",
-                reach=5,
-            )
-        ],
-    )
+from models.characters import Character
+from models.game_state import GameState, GameStatus
+from tests._factories import make_character
+
+
+def _center(gs: GameState) -> tuple[int, int]:
+    """The GOLEM's spawn point on this game's grid."""
+    return golem_center_position(len(gs.grid[0]), len(gs.grid))
+
+
+def _only_npc(gs: GameState) -> Character:
+    """Return the first NPC in the game without building a list."""
+    return next(c for c in gs.characters.values() if c.is_npc)
+
+
+# Never mutated; fresh_golem hands out copies
+_GOLEM_PROTO: Final = create_golem()
+
+
+@pytest.fixture
+def fresh_golem() -> Character:
+    """A new GOLEM copied from the validated prototype."""
+    return _GOLEM_PROTO.model_copy(update={
+        "id": str(uuid4()),
+        "conditions": [],
+        "attacks": list(_GOLEM_PROTO.attacks),
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -71,42 +72,50 @@ class TestCreateGolem:
         assert len(g.attacks) == 1
         assert g.attacks[0].name == "Stone Fist"
 
+    def test_golems_share_attack_instance(self):
+        assert create_golem().attacks[0] is create_golem().attacks[0]
+
     def test_golem_center(self):
         x, y = golem_center_position()
         assert x == 10
         assert y == 10
 
+    def test_golem_center_of_custom_grid(self):
+        assert golem_center_position(8, 6) == (4, 3)
+
 
 # ---------------------------------------------------------------------------
 # spawn_npcs
 # ---------------------------------------------------------------------------
 
 class TestSpawnNPCs:
-    def test_spawns_golem_on_empty_game(self):
-        gs = create_game("test")
+    def test_spawns_golem_on_empty_game(self, gs):
         assert len(gs.characters) == 0
         spawn_npcs(gs)
         assert len(gs.characters) == 1
-        golem = list(gs.characters.values())[0]
+        golem = next(iter(gs.characters.values()))
         assert golem.name == GOLEM_NAME
         assert golem.is_npc is True
-        assert golem.position == golem_center_position()
+        assert golem.position == _center(gs)
 
-    def test_idempotent(self):
-        gs = create_game("test")
+    def test_spawns_golem_on_small_grid(self):
+        gs = create_game("small", width=8, height=8)
+        spawn_npcs(gs)
+        assert _only_npc(gs).position == (4, 4)
+
+    def test_idempotent(self, gs):
         spawn_npcs(gs)
         spawn_npcs(gs)
         npcs = [c for c in gs.characters.values() if c.is_npc]
         assert len(npcs) == 1
 
-    def test_finds_alternate_position_if_center_occupied(self):
-        gs = create_game("test")
-        cx, cy = golem_center_position()
+    def test_finds_alternate_position_if_center_occupied(self, gs):
+        cx, cy = _center(gs)
         # Place a player at the center
-        p = _make_player("p1", "owner1")
+        p = make_character("p1", "owner1")
         add_character(gs, p, (cx, cy))
         spawn_npcs(gs)
-        golem = [c for c in gs.characters.values() if c.is_npc][0]
+        golem = _only_npc(gs)
         assert golem.position != (cx, cy)
         assert golem.position is not None
 
@@ -116,11 +125,10 @@ class TestSpawnNPCs:
 # ---------------------------------------------------------------------------
 
 class TestWinConditionWithNPC:
-    def test_npc_not_counted_as_team(self):
-        gs = create_game("test")
+    def test_npc_not_counted_as_team(self, gs):
         spawn_npcs(gs)
-        p1 = _make_player("p1", "owner1")
-        p2 = _make_player("p2", "owner2")
+        p1 = make_character("p1", "owner1")
+        p2 = make_character("p2", "owner2")
         add_character(gs, p1, (1, 1))
         add_character(gs, p2, (3, 3))
         # Kill p2 — owner1 should win, GOLEM should not prevent that
@@ -128,10 +136,9 @@ class TestWinConditionWithNPC:
         gs.characters["p2"].current_hp = 0
         assert check_win_condition(gs) == "owner1"
 
-    def test_npc_alone_no_winner(self):
-        gs = create_game("test")
+    def test_npc_alone_no_winner(self, gs):
         spawn_npcs(gs)
-        p1 = _make_player("p1", "owner1")
+        p1 = make_character("p1", "owner1")
         add_character(gs, p1, (1, 1))
         gs.characters["p1"].is_alive = False
         # Only NPC alive — no winner (draw)
@@ -142,19 +149,29 @@ class TestWinConditionWithNPC:
 # GOLEM AI behaviour
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def _golem_base(_proto_game) -> bytes:
+    """A game with a GOLEM at (10, 10), pickled together with the GOLEM."""
+    gs = pickle.loads(_proto_game)
+    golem = create_golem()
+    add_character(gs, golem, (10, 10))
+    return pickle.dumps((gs, golem))
+
+
 class TestGolemAI:
-    def test_ends_turn_when_not_provoked(self):
-        gs = create_game("test")
-        golem = create_golem()
-        add_character(gs, golem, (10, 10))
+    @pytest.fixture
+    def golem_game(self, _golem_base) -> tuple[GameState, Character]:
+        """A fresh (game, GOLEM) pair; the GOLEM is the one on the board."""
+        return pickle.loads(_golem_base)
+
+    def test_ends_turn_when_not_provoked(self, golem_game):
+        gs, golem = golem_game
         action = resolve_npc_turn(golem, gs)
         assert action.action_type == ActionType.END_TURN
 
-    def test_attacks_adjacent_when_provoked(self):
-        gs = create_game("test")
-        golem = create_golem()
-        add_character(gs, golem, (10, 10))
-        p1 = _make_player("p1", "owner1")
+    def test_attacks_adjacent_when_provoked(self, golem_game):
+        gs, golem = golem_game
+        p1 = make_character("p1", "owner1")
         add_character(gs, p1, (10, 11))  # adjacent
         golem.conditions.append("provoked")
         action = resolve_npc_turn(golem, gs)
@@ -163,11 +180,9 @@ class TestGolemAI:
         # provoked should be cleared
         assert "provoked" not in golem.conditions
 
-    def test_ends_turn_when_provoked_but_nobody_adjacent(self):
-        gs = create_game("test")
-        golem = create_golem()
-        add_character(gs, golem, (10, 10))
-        p1 = _make_player("p1", "owner1")
+    def test_ends_turn_when_provoked_but_nobody_adjacent(self, golem_game):
+        gs, golem = golem_game
+        p1 = make_character("p1", "owner1")
         add_character(gs, p1, (1, 1))  # far away
         golem.conditions.append("provoked")
         action = resolve_npc_turn(golem, gs)
@@ -180,22 +195,19 @@ class TestGolemAI:
 # ---------------------------------------------------------------------------
 
 class TestProvocation:
-    def test_damage_provokes_npc(self):
-        from engine.rules import apply_damage
-        golem = create_golem()
+    def test_damage_provokes_npc(self, fresh_golem):
+        golem = fresh_golem
         assert "provoked" not in golem.conditions
         apply_damage(golem, 5)
         assert "provoked" in golem.conditions
 
     def test_damage_does_not_provoke_player(self):
-        from engine.rules import apply_damage
-        p = _make_player("p1", "owner1")
+        p = make_character("p1", "owner1")
         apply_damage(p, 5)
         assert "provoked" not in p.conditions
 
-    def test_killing_blow_does_not_provoke(self):
-        from engine.rules import apply_damage
-        golem = create_golem()
+    def test_killing_blow_does_not_provoke(self, fresh_golem):
+        golem = fresh_golem
         apply_damage(golem, 999)
         assert not golem.is_alive
         assert "provoked" not in golem.conditions
@@ -205,26 +217,29 @@ class TestProvocation:
 # Combat-start requirement (NPCs don't count toward 2-player minimum)
 # ---------------------------------------------------------------------------
 
+@pytest.fixture
+def npc_combat(gs) -> GameState:
+    """Two players plus the spawned GOLEM, with combat started."""
+    spawn_npcs(gs)
+    add_character(gs, make_character("p1", "owner1"), (1, 1))
+    add_character(gs, make_character("p2", "owner2"), (3, 3))
+    start_combat(gs)
+    return gs
+
+
 class TestCombatStartWithNPC:
-    def test_need_two_players_not_just_npc(self):
-        gs = create_game("test")
+    def test_need_two_players_not_just_npc(self, gs):
         spawn_npcs(gs)
-        p1 = _make_player("p1", "owner1")
+        p1 = make_character("p1", "owner1")
         add_character(gs, p1, (1, 1))
         with pytest.raises(ValueError, match="at least 2"):
             start_combat(gs)
 
-    def test_two_players_with_npc_starts_fine(self):
-        gs = create_game("test")
-        spawn_npcs(gs)
-        p1 = _make_player("p1", "owner1")
-        p2 = _make_player("p2", "owner2")
-        add_character(gs, p1, (1, 1))
-        add_character(gs, p2, (3, 3))
-        start_combat(gs)
+    def test_two_players_with_npc_starts_fine(self, npc_combat):
+        gs = npc_combat
         assert gs.status == GameStatus.ACTIVE
         # GOLEM should be in initiative order
-        golem_id = [c.id for c in gs.characters.values() if c.is_npc][0]
+        golem_id = _only_npc(gs).id
         assert golem_id in gs.initiative_order
 
 
@@ -232,51 +247,32 @@ class TestCombatStartWithNPC:
 # End-of-combat respawn
 # ---------------------------------------------------------------------------
 
-class TestEndCombatRespawn:
-    def test_golem_respawns_after_death(self):
-        gs = create_game("test")
-        spawn_npcs(gs)
-        p1 = _make_player("p1", "owner1")
-        p2 = _make_player("p2", "owner2")
-        add_character(gs, p1, (1, 1))
-        add_character(gs, p2, (3, 3))
-        start_combat(gs)
+def _finish_combat(gs: GameState, winner_id: str = "owner1") -> None:
+    """Mark combat as won and run the end-of-combat transition."""
+    gs.status = GameStatus.COMPLETED
+    gs.winner_id = winner_id
+    end_combat(gs)
+
 
-        # Kill the GOLEM
-        golem = [c for c in gs.characters.values() if c.is_npc][0]
-        golem.current_hp = 0
-        golem.is_alive = False
-        gs.status = GameStatus.COMPLETED
-        gs.winner_id = "owner1"
+class TestEndCombatRespawn:
+    @pytest.mark.parametrize("golem_hp,golem_alive", [
+        (0, False),    # killed: respawned
+        (50, True),    # wounded and provoked: healed and calmed
+    ])
+    def test_golem_restored_after_combat(self, npc_combat, golem_hp, golem_alive):
+        gs = npc_combat
+        golem = _only_npc(gs)
+        golem.current_hp = golem_hp
+        golem.is_alive = golem_alive
+        golem.conditions.append("provoked")
+        gs.characters["p2"].is_alive = False
+        gs.characters["p2"].current_hp = 0
 
-        end_combat(gs)
+        _finish_combat(gs)
 
         assert gs.status == GameStatus.WAITING
         npcs = [c for c in gs.characters.values() if c.is_npc]
         assert len(npcs) == 1
         assert npcs[0].is_alive
         assert npcs[0].current_hp == npcs[0].max_hp
-
-    def test_surviving_golem_healed_after_combat(self):
-        gs = create_game("test")
-        spawn_npcs(gs)
-        p1 = _make_player("p1", "owner1")
-        p2 = _make_player("p2", "owner2")
-        add_character(gs, p1, (1, 1))
-        add_character(gs, p2, (3, 3))
-        start_combat(gs)
-
-        golem = [c for c in gs.characters.values() if c.is_npc][0]
-        golem.current_hp = 50
-        golem.conditions.append("provoked")
-
-        gs.characters["p2"].is_alive = False
-        gs.characters["p2"].current_hp = 0
-        gs.status = GameStatus.COMPLETED
-        gs.winner_id = "owner1"
-
-        end_combat(gs)
-
-        golem_after = [c for c in gs.characters.values() if c.is_npc][0]
-        assert golem_after.current_hp == golem_after.max_hp
-        assert "provoked" not in golem_after.conditions
+        assert "provoked" not in npcs[0].conditions
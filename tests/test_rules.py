@@ -1,8 +1,13 @@
 """Tests for D&D 5e SRD combat rules."""
 
+from collections.abc import Callable, Iterator
+
 import pytest
+from hypothesis import HealthCheck, example, given, settings
+from hypothesis import strategies as st
 
 from engine.rules import (
+    ErrorCode,
     apply_damage,
     calculate_ability_modifier,
     check_death,
@@ -11,204 +16,168 @@ from engine.rules import (
 )
 from engine.grid import create_grid
 from models.actions import ActionType
-from models.characters import AbilityScores, Attack, Character
-from models.game_state import GameState
-
-
-def _make_character(
-    char_id: str = "c1",
-    owner_id: str = "owner1",
-    position: tuple[int, int] | None = (2, 2),
-    hp: int = 20,
-    ac: int = 15,
-    dex: int = 14,
-) -> Character:
-    """Helper to create a test character."""
-    return Character(
-        id=char_id,
-        name=f"Char_{char_id}",
-        owner_id=owner_id,
-        ability_scores=AbilityScores(dexterity=dex),
-        max_hp=hp,
-        current_hp=hp,
-        armor_class=ac,
-        speed=30,
-        position=position,
-        attacks=[
-            Attack(
-                name="Sword",
-                attack_bonus=5,
-                damage_dice="1d8",
-                damage_bonus=3,
-                damage_type="slashing",
-                reach=5,
-            )
-        ],
-    )
-
-
-def _make_game_state() -> GameState:
-    """Helper to create a test game state with two characters."""
-    grid = create_grid(10, 10)
-    gs = GameState(game_id="test", grid=grid)
-
-    c1 = _make_character("c1", "owner1", position=(2, 2))
-    c2 = _make_character("c2", "owner2", position=(3, 2))
-
-    gs.characters["c1"] = c1
-    gs.characters["c2"] = c2
-    gs.grid[2][2].occupant_id = "c1"
-    gs.grid[2][3].occupant_id = "c2"
-
+from models.characters import Character
+from models.game_state import GameState, GridCell
+from tests._factories import make_character
+
+
+def _place(gs: GameState, char: Character) -> None:
+    """Add a positioned character to the game and mark its cell occupied."""
+    x, y = char.position
+    gs.characters[char.id] = char
+    gs.grid[y][x].occupant_id = char.id
+
+
+@pytest.fixture(scope="module")
+def base_grid() -> list[list[GridCell]]:
+    """One 10x10 grid shared by the module's games; tests must not change terrain."""
+    return create_grid(10, 10)
+
+
+@pytest.fixture
+def game_state(base_grid) -> Iterator[GameState]:
+    """A game with c1 at (2, 2) next to c2 at (3, 2), on the shared grid."""
+    gs = GameState(game_id="test", grid=base_grid)
+    _place(gs, make_character("c1", "owner1", position=(2, 2)))
+    _place(gs, make_character("c2", "owner2", position=(3, 2)))
+    yield gs
+    # Only occupancy varies between tests; clear it for the next one
+    for row in base_grid:
+        for cell in row:
+            cell.occupant_id = None
+
+
+@pytest.fixture(scope="module")
+def readonly_gs() -> GameState:
+    """The same two-character layout, built once for tests that never mutate it."""
+    gs = GameState(game_id="test", grid=create_grid(10, 10))
+    _place(gs, make_character("c1", "owner1", position=(2, 2)))
+    _place(gs, make_character("c2", "owner2", position=(3, 2)))
     return gs
 
 
-class TestAbilityModifier:
-    """Tests for calculate_ability_modifier()."""
-
-    def test_score_10(self):
-        assert calculate_ability_modifier(10) == 0
-
-    def test_score_16(self):
-        assert calculate_ability_modifier(16) == 3
-
-    def test_score_8(self):
-        assert calculate_ability_modifier(8) == -1
-
-    def test_score_1(self):
-        assert calculate_ability_modifier(1) == -5
+@pytest.fixture
+def char_factory() -> Callable[..., Character]:
+    """Build fresh living characters; accepts make_character's keyword arguments."""
+    return make_character
 
-    def test_score_20(self):
-        assert calculate_ability_modifier(20) == 5
 
-    def test_score_11(self):
-        """Odd scores round down."""
-        assert calculate_ability_modifier(11) == 0
+class TestAbilityModifier:
+    """Tests for calculate_ability_modifier()."""
 
-    def test_score_9(self):
-        assert calculate_ability_modifier(9) == -1
+    @pytest.mark.parametrize("score,expected", [
+        (10, 0),
+        (16, 3),
+        (8, -1),
+        (1, -5),
+        (20, 5),
+        (11, 0),   # odd scores round down
+        (9, -1),
+    ])
+    def test_modifier(self, score, expected):
+        assert calculate_ability_modifier(score) == expected
 
 
 class TestRollInitiative:
     """Tests for roll_initiative()."""
 
     def test_returns_int(self):
-        char = _make_character(dex=14)
+        char = make_character(dex=14)
         result = roll_initiative(char)
         assert isinstance(result, int)
 
-    def test_includes_dex_modifier(self):
+    @pytest.mark.parametrize("d20,expected", [(1, 3), (20, 22)])
+    def test_includes_dex_modifier(self, monkeypatch, d20, expected):
         """Initiative should be d20 + dex modifier, so range is (1+mod) to (20+mod)."""
-        char = _make_character(dex=14)  # +2 modifier
-        results = [roll_initiative(char) for _ in range(100)]
-        assert min(results) >= 3   # 1 + 2
-        assert max(results) <= 22  # 20 + 2
+        monkeypatch.setattr("engine.rules.roll_d20", lambda: d20)
+        char = make_character(dex=14)  # +2 modifier
+        assert roll_initiative(char) == expected
+
+
+def _kill(char_id: str) -> Callable[[GameState], None]:
+    """Mutator that marks a character dead."""
+    def mutate(gs: GameState) -> None:
+        gs.characters[char_id].is_alive = False
+        gs.characters[char_id].current_hp = 0
+    return mutate
+
+
+def _move_c2_away(gs: GameState) -> None:
+    gs.characters["c2"].position = (9, 9)
 
 
 class TestValidateAction:
     """Tests for validate_action()."""
 
-    def test_end_turn_always_valid(self):
-        gs = _make_game_state()
-        valid, err = validate_action(ActionType.END_TURN, gs.characters["c1"], gs)
-        assert valid
-        assert err == ""
-
-    def test_attack_valid_adjacent(self):
-        gs = _make_game_state()
-        valid, err = validate_action(
-            ActionType.ATTACK, gs.characters["c1"], gs, target_id="c2",
+    # Scenarios that only read the game share one module-scoped copy
+    @pytest.mark.parametrize("action,target_id,valid,expected_err", [
+        pytest.param(ActionType.END_TURN, None, True, "", id="end_turn"),
+        pytest.param(ActionType.ATTACK, "c2", True, "", id="attack_adjacent"),
+        pytest.param(ActionType.ATTACK, None, False, ErrorCode.NO_TARGET, id="attack_no_target"),
+        pytest.param(ActionType.DODGE, None, True, "", id="dodge"),
+        pytest.param(ActionType.DASH, None, True, "", id="dash"),
+        pytest.param(ActionType.MOVE, None, False, ErrorCode.NEEDS_POSITION, id="move_requires_position"),
+    ])
+    def test_validate_action(self, readonly_gs, action, target_id, valid, expected_err):
+        gs = readonly_gs
+        ok, err = validate_action(action, gs.characters["c1"], gs, target_id=target_id)
+        assert ok is valid
+        if valid:
+            assert err == ""
+        else:
+            assert err is expected_err
+
+    # Scenarios that change the game before validating get their own copy
+    @pytest.mark.parametrize("mutate,expected_err", [
+        pytest.param(_kill("c2"), ErrorCode.DEAD_TARGET, id="attack_dead_target"),
+        pytest.param(_move_c2_away, "out of reach", id="attack_out_of_range"),
+        pytest.param(_kill("c1"), ErrorCode.CASTER_DEAD, id="dead_character_cant_act"),
+    ])
+    def test_attack_after_change(self, game_state, mutate, expected_err):
+        mutate(game_state)
+        ok, err = validate_action(
+            ActionType.ATTACK, game_state.characters["c1"], game_state, target_id="c2",
         )
-        assert valid
+        assert not ok
+        if isinstance(expected_err, ErrorCode):
+            assert err is expected_err
+        else:
+            # Range errors carry the distance, so only the prefix is fixed
+            assert expected_err in err
 
-    def test_attack_no_target(self):
-        gs = _make_game_state()
-        valid, err = validate_action(
-            ActionType.ATTACK, gs.characters["c1"], gs,
-        )
-        assert not valid
-        assert "target_id" in err.lower()
-
-    def test_attack_dead_target(self):
-        gs = _make_game_state()
-        gs.characters["c2"].is_alive = False
-        gs.characters["c2"].current_hp = 0
-        valid, err = validate_action(
-            ActionType.ATTACK, gs.characters["c1"], gs, target_id="c2",
-        )
-        assert not valid
-        assert "dead" in err.lower()
-
-    def test_attack_out_of_range(self):
-        gs = _make_game_state()
-        gs.characters["c2"].position = (9, 9)
-        valid, err = validate_action(
-            ActionType.ATTACK, gs.characters["c1"], gs, target_id="c2",
-        )
-        assert not valid
-        assert "reach" in err.lower() or "range" in err.lower()
-
-    def test_dead_character_cant_act(self):
-        gs = _make_game_state()
-        gs.characters["c1"].is_alive = False
-        valid, err = validate_action(
-            ActionType.ATTACK, gs.characters["c1"], gs, target_id="c2",
-        )
-        assert not valid
-        assert "dead" in err.lower()
-
-    def test_dodge_valid(self):
-        gs = _make_game_state()
-        valid, err = validate_action(ActionType.DODGE, gs.characters["c1"], gs)
-        assert valid
-
-    def test_dash_valid(self):
-        gs = _make_game_state()
-        valid, err = validate_action(ActionType.DASH, gs.characters["c1"], gs)
-        assert valid
-
-    def test_move_requires_position(self):
-        gs = _make_game_state()
-        valid, err = validate_action(
-            ActionType.MOVE, gs.characters["c1"], gs,
-        )
-        assert not valid
-        assert "target_position" in err.lower()
+    def test_error_code_formats_as_message(self):
+        assert str(ErrorCode.NO_TARGET) == "Attack action requires a target_id"
+        assert f"{ErrorCode.DEAD_TARGET}" == "Target is already dead"
 
 
 class TestApplyDamage:
     """Tests for apply_damage() and check_death()."""
 
-    def test_basic_damage(self):
-        char = _make_character(hp=20)
-        apply_damage(char, 5)
-        assert char.current_hp == 15
-        assert char.is_alive
-
-    def test_lethal_damage(self):
-        char = _make_character(hp=20)
-        apply_damage(char, 20)
-        assert char.current_hp == 0
-        assert not char.is_alive
-
-    def test_overkill_damage(self):
-        """Damage beyond 0 HP doesn't go negative."""
-        char = _make_character(hp=10)
-        apply_damage(char, 50)
-        assert char.current_hp == 0
-        assert not char.is_alive
-
-    def test_zero_damage(self):
-        char = _make_character(hp=20)
-        apply_damage(char, 0)
-        assert char.current_hp == 20
-        assert char.is_alive
-
-    def test_check_death_alive(self):
-        char = _make_character(hp=20)
+    @pytest.fixture
+    def victim(self, char_factory) -> Character:
+        """One character per test; the property test resets it per example."""
+        return char_factory()
+
+    # The fixture is built once for all examples, which is intended: each
+    # example resets every field apply_damage touches.
+    @settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @given(hp=st.integers(1, 200), damage=st.integers(0, 500))
+    @example(hp=20, damage=20)   # exactly lethal
+    @example(hp=10, damage=50)   # overkill doesn't go negative
+    @example(hp=20, damage=0)    # zero damage
+    def test_damage(self, victim, hp, damage):
+        victim.max_hp = victim.current_hp = hp
+        victim.is_alive = True
+        apply_damage(victim, damage)
+        assert victim.current_hp == max(0, hp - damage)
+        assert 0 <= victim.current_hp <= victim.max_hp
+        assert victim.is_alive is (victim.current_hp > 0)
+
+    def test_check_death_alive(self, char_factory):
+        char = char_factory(hp=20)
         assert not check_death(char)
 
-    def test_check_death_dead(self):
-        char = _make_character(hp=20)
+    def test_check_death_dead(self, char_factory):
+        char = char_factory(hp=20)
         char.current_hp = 0
         assert check_death(char)